@@ -48,8 +48,7 @@ class GetCommand(BaseCommand):
         ids = [int(id.strip()) for id in ids_str.split(',') if id.strip()]
         assets = []
         
-        for asset_id in ids:
-            asset = self.client.get_object(asset_id)
+        for asset_id, asset in zip(ids, self.client.get_objects(ids)):
             if asset:
                 assets.append(asset)
             else:
@@ -81,8 +81,7 @@ class ProcessCommand(BaseCommand):
                 asset_ids = [int(id.strip()) for id in args.ids.split(',') if id.strip()]
                 self.logger.info(f"Processing {len(asset_ids)} assets by ID")
                 assets = []
-                for asset_id in asset_ids:
-                    asset = self.client.get_object(asset_id)
+                for asset_id, asset in zip(asset_ids, self.client.get_objects(asset_ids)):
                     if asset:
                         assets.append(asset)
                     else:
@@ -105,21 +104,11 @@ class ProcessCommand(BaseCommand):
             self.logger.info(f"Found {len(assets)} assets matching query")
             self.logger.info(f"Processing {len(assets)} assets...")
 
-            # Process assets
-            results = {}
-            processed_assets = []  # Keep track of the assets we process
-            
-            for asset in assets:
-                asset_id = asset.id
-                try:
-                    # Process the asset
-                    self.processor.process_asset(asset)
-                    self.logger.info(f"Successfully updated asset {asset_id}")
-                    results[asset_id] = True
-                    processed_assets.append(asset)
-                except Exception as e:
-                    self.logger.error(f"Failed to process asset {asset_id}: {str(e)}")
-                    results[asset_id] = False
+            # Process assets, sending their updates concurrently
+            results = self.processor.process_assets(assets)
+            processed_assets = [asset for asset in assets if results.get(asset.id)]
+            for asset in processed_assets:
+                self.logger.info(f"Successfully updated asset {asset.id}")
 
             # Display summary of results
             success_count = sum(1 for status in results.values() if status)
@@ -4,6 +4,12 @@ from ...webhooks.server import start_webhook_server
 from ...logging.logger import Logger
 from ..command_base import BaseCommand  # Fix: Changed from CommandBase to BaseCommand
 
+# uvloop runs the server on libuv when installed; it is not available on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 class WebhookCommand(BaseCommand):
     """Command for managing webhooks."""
 
@@ -25,6 +31,8 @@ class WebhookCommand(BaseCommand):
         """Execute the webhook command."""
         if args.action == 'start':
             # Run the async server in the event loop
+            if uvloop is not None:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
             try:
                 asyncio.run(self._run_server(args))
                 return True
@@ -49,6 +49,8 @@ class Config:
     
     # Webhook configuration
     WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET')
+    # Secret pre-encoded once for byte-level auth and signature checks
+    WEBHOOK_SECRET_BYTES = WEBHOOK_SECRET.encode() if WEBHOOK_SECRET is not None else None
     WEBHOOK_ENABLED = os.getenv('WEBHOOK_ENABLED', 'false').lower() == 'true'
     WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', '8000'))
     WEBHOOK_HOST = os.getenv('WEBHOOK_HOST', '0.0.0.0')
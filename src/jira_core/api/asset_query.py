@@ -47,6 +47,44 @@ def validate_query(query: str) -> str:
             
     return query
 
+def _post_aql(client, query, start_at=0, max_results=50, include_attributes=True):
+    """
+    Send a raw AQL query to the ``object/aql`` endpoint.
+    
+    Centralizes construction of the AQL request so every caller shares
+    the same pagination parameters and service info.
+    
+    Args:
+        client: AssetsClient instance
+        query: AQL query string (already validated)
+        start_at: Index of first result
+        max_results: Maximum number of results
+        include_attributes: Whether to include asset attributes
+        
+    Returns:
+        dict: Raw JSON response from the API
+    """
+    service_info = {
+        'includeAttributes': include_attributes,
+        'includeAttributeValues': include_attributes,
+        'includeTypeAttributes': include_attributes,
+        'includeAttributeNames': include_attributes
+    }
+    
+    return BaseHandler.make_request(
+        client=client,
+        method='POST',
+        endpoint='object/aql',
+        params={
+            'startAt': start_at,
+            'maxResults': max_results
+        },
+        json={
+            'qlQuery': query,
+            'serviceInfo': service_info
+        }
+    )
+
 def get_objects_aql(client, query, start_at=0, max_results=50, include_attributes=True):
     """
     Execute AQL query to retrieve assets.
@@ -74,28 +112,8 @@ def get_objects_aql(client, query, start_at=0, max_results=50, include_attribute
     
     client.logger.debug(f"Full AQL query: {query}")
     
-    # Set up service info for attribute inclusion
-    service_info = {
-        'includeAttributes': include_attributes,
-        'includeAttributeValues': include_attributes,
-        'includeTypeAttributes': include_attributes,
-        'includeAttributeNames': include_attributes
-    }
-    
     # Make the API request
-    response = BaseHandler.make_request(
-        client,
-        'POST',
-        'object/aql',
-        params={
-            'startAt': start_at,
-            'maxResults': max_results
-        },
-        json={
-            'qlQuery': query,
-            'serviceInfo': service_info
-        }
-    )
+    response = _post_aql(client, query, start_at, max_results, include_attributes)
     
     # Extract the values (list of objects)
     result_values = response.get('values', [])
@@ -121,16 +139,8 @@ def get_objects_aql(client, query, start_at=0, max_results=50, include_attribute
             if attr_id and attr_name:
                 attr_defs[attr_id] = attr_name
     
-    # Convert raw API results to Asset objects
-    assets = []
-    for value in result_values:
-        try:
-            # Create Asset object and add to list
-            asset = Asset(value, attr_defs)
-            assets.append(asset)
-        except Exception as e:
-            client.logger.error(f"Error creating Asset object from response: {str(e)}")
-            # Continue processing other assets even if one fails
+    # Convert raw API results to Asset objects, skipping any that fail to build
+    assets = Asset.from_response(result_values, attr_defs, logger=client.logger)
     
     client.logger.debug(f"Converted {len(assets)} raw objects to Asset objects")
     return assets
\ No newline at end of file
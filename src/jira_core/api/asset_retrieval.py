@@ -3,6 +3,8 @@ Single asset retrieval functionality for Jira Assets API.
 
 This module provides functionality to fetch individual assets by their ID.
 """
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
 from ..models import Asset
 from ..exceptions import AssetNotFoundError
 from .base_handler import BaseHandler
@@ -28,3 +30,38 @@ def get_object(client, object_id: str) -> Asset:
     except AssetNotFoundError:
         client.logger.error(f"Asset with ID '{object_id}' does not exist")
         raise
+
+def get_objects(client, object_ids: Iterable[str], max_workers: int = 8) -> List[Asset]:
+    """
+    Retrieve several asset objects by ID concurrently.
+    
+    Requests are issued from a thread pool over the client's shared HTTP
+    session, so round trips overlap instead of running back to back.
+    Duplicate IDs are fetched only once.
+    
+    Args:
+        client: AssetsClient instance
+        object_ids: IDs of the assets to retrieve
+        max_workers: Maximum number of concurrent requests
+        
+    Returns:
+        List of Asset objects in the same order as object_ids
+        
+    Raises:
+        AssetNotFoundError: If any of the assets doesn't exist
+    """
+    object_ids = list(object_ids)
+    # Fetch each distinct ID once, even if it is requested several times
+    unique_ids = list(dict.fromkeys(object_ids))
+    if len(unique_ids) <= 1:
+        assets = [get_object(client, object_id) for object_id in unique_ids]
+    else:
+        # Every fetch validates against the schema; resolve it once before fanning out
+        client.ensure_schema()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            assets = list(executor.map(lambda object_id: get_object(client, object_id), unique_ids))
+    
+    if len(unique_ids) == len(object_ids):
+        return assets
+    by_id = dict(zip(unique_ids, assets))
+    return [by_id[object_id] for object_id in object_ids]
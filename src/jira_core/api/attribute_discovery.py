@@ -87,6 +87,7 @@ def get_attributes_from_sample_object(client, object_type_id: str) -> Dict[str,
         Dict[str, str]: A mapping of attribute names (lowercase) to their IDs
     """
     from .base_handler import BaseHandler
+    from .asset_query import _post_aql
     
     client.logger.debug(f"Getting attributes from sample object of type {object_type_id}")
     
@@ -94,16 +95,7 @@ def get_attributes_from_sample_object(client, object_type_id: str) -> Dict[str,
         # Query for objects of this type
         query = f'objectType = {object_type_id} ORDER BY created DESC'
         
-        response = BaseHandler.make_request(
-            client,
-            'POST',
-            'object/aql',
-            json={
-                'qlQuery': query,
-                'startAt': 0,
-                'maxResults': 1
-            }
-        )
+        response = _post_aql(client, query, start_at=0, max_results=1)
         
         # Check if we have results
         if 'values' not in response or not response['values']:
@@ -4,12 +4,36 @@ Base request handler for Jira Assets API.
 This module provides core functionality for making API requests
 to the Jira Assets API, handling errors, and validating responses.
 """
+import logging
+import re
 import requests
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Union
 import json
 from ..exceptions import AssetNotFoundError, AssetsError, SchemaError, InvalidQueryError, ApiError, ValidationError
 from .response_validator import ResponseValidator
 
+if TYPE_CHECKING:
+    from ..asset_client import AssetsClient
+
+# Keywords used to classify 400 error messages, matched in a single scan
+_ERR_CLASSIFY = re.compile(r'invalid|syntax|malformed|schema', re.IGNORECASE)
+_QUERY_ERROR_TAGS = frozenset(('invalid', 'syntax', 'malformed'))
+
+# HTTP methods that send a JSON body
+_JSON_BODY_METHODS = frozenset(('POST', 'PUT', 'PATCH'))
+_GET = 'GET'
+
+# Prefer orjson for (de)serialization, falling back to the stdlib codec
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 class BaseHandler:
     """
     Base handler for making API requests to Jira Assets API.
@@ -17,34 +41,44 @@ class BaseHandler:
     Provides static methods for making requests and validating responses.
     """
     
+    _DEFAULT_EXPAND = ('attributes', 'objectType', 'attributeValues')
+    _DEFAULT_EXPAND_CSV = ','.join(_DEFAULT_EXPAND)
+    _DEFAULT_EXPAND_TYPED_CSV = ','.join(_DEFAULT_EXPAND + ('objectTypeAttributes',))
+    
     GET_PARAMS = {
         'includeAttributes': 'true',
         'attributeNames': '*',
-        'expand': 'attributes,objectType,attributeValues'
+        'expand': _DEFAULT_EXPAND_CSV
     }
     
     @staticmethod
-    def handle_response(response, logger=None):
-        """Process API response and handle any errors."""
-        try:
-            # Get response body
-            response_data = response.json()
-            
-            # Skip validation for array responses
-            if isinstance(response_data, list):
-                return response_data
-                
-            # Validate dict responses
-            ResponseValidator.validate_response(response_data, logger)
-            
-            return response_data
+    def handle_response(data: Any, status_code: int, logger: Optional[Any] = None) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Validate an already-parsed API response body.
+        
+        Args:
+            data: Parsed JSON body, or None if the body was empty or not valid JSON
+            status_code: HTTP status code of the response
+            logger: Optional logger instance
             
-        except json.JSONDecodeError:
-            error_msg = f"Invalid JSON response from API (status {response.status_code})"
+        Returns:
+            The parsed response body
+        """
+        if data is None:
+            error_msg = f"Invalid JSON response from API (status {status_code})"
             if logger:
                 logger.error(error_msg)
             raise ApiError(error_msg)
-        except ValidationError as e:
+            
+        # Skip validation for array responses
+        if isinstance(data, list):
+            return data
+            
+        try:
+            # Validate dict responses
+            ResponseValidator.validate_response(data, logger)
+            return data
+        except ValidationError:
             # Pass through validation errors
             raise
         except Exception as e:
@@ -55,11 +89,11 @@ class BaseHandler:
     
     @staticmethod
     def make_request(
-        client, 
+        client: "AssetsClient", 
         method: str, 
         endpoint: str, 
-        params: Optional[Dict] = None, 
-        json: Optional[Dict] = None,
+        params: Optional[Dict[str, Any]] = None, 
+        json: Optional[Dict[str, Any]] = None,
         include_type_attributes: bool = False,
         use_base_url: bool = True
     ) -> Dict[str, Any]:
@@ -85,116 +119,89 @@ class BaseHandler:
             AssetsError: For general API errors
             requests.exceptions.RequestException: For network-related errors
         """
-        url = f"{client.base_url}/{endpoint.lstrip('/')}" if use_base_url else endpoint
+        if use_base_url:
+            path = endpoint[1:] if endpoint.startswith('/') else endpoint
+            url = f"{client.base_url}/{path}"
+        else:
+            url = endpoint
         
-        client.logger.debug(f"Making {method} request to: {url}")
+        # Skip building debug strings entirely when DEBUG is disabled
+        debug_enabled = client.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            client.logger.debug(f"Making {method} request to: {url}")
         
-        request_params = params or {}
-        if method.upper() == 'GET':
-            # Start with default parameters
-            if not params or 'includeAttributes' not in params:
-                request_params['includeAttributes'] = 'true'
-            if not params or 'attributeNames' not in params:
-                request_params['attributeNames'] = '*'
-            
-            # Handle expand parameters
-            expand_values = set()
-            
-            # Start with default expands
-            default_expands = ['attributes', 'objectType', 'attributeValues']
-            for value in default_expands:
-                expand_values.add(value)
-            
-            # Add objectTypeAttributes if requested
-            if include_type_attributes or ('objecttype/' in endpoint and 'objectTypeAttributes' not in expand_values):
-                expand_values.add('objectTypeAttributes')
-                
-            # If params has an 'expand' parameter, add those values too
-            if params and 'expand' in params:
-                for value in params['expand'].split(','):
-                    if value:
-                        expand_values.add(value)
-                        
-            # Set the final combined expand parameter
-            request_params['expand'] = ','.join(expand_values)
+        method_upper = method.upper()
+        if method_upper == _GET:
+            # Add objectTypeAttributes for object type endpoints or when requested
+            if include_type_attributes or endpoint.startswith(('objecttype/', '/objecttype/')):
+                default_expand = BaseHandler._DEFAULT_EXPAND_TYPED_CSV
+            else:
+                default_expand = BaseHandler._DEFAULT_EXPAND_CSV
             
-            # Update with any remaining parameters
+            # Start with default parameters, letting explicit params override them
+            request_params = {**BaseHandler.GET_PARAMS, 'expand': default_expand}
             if params:
-                for key, value in params.items():
-                    if key != 'expand':  # We've already handled expand
-                        request_params[key] = value
+                request_params.update(params)
+                
+                # Merge an explicit expand parameter with the defaults
+                if 'expand' in params:
+                    expand_values = set(default_expand.split(','))
+                    expand_values.update(value for value in params['expand'].split(',') if value)
+                    request_params['expand'] = ','.join(expand_values)
+        else:
+            request_params = params or {}
         
         # Debug parameters
-        client.logger.debug(f"Request parameters: {request_params}")
+        if debug_enabled:
+            client.logger.debug(f"Request parameters: {request_params}")
         
-        headers = {"Accept": "application/json", "Authorization": f"Basic {client.basic_auth}"}
-        if json:
+        if json and debug_enabled:
             client.logger.debug(f"Request payload: {json}")
             
-        if method.upper() in ['POST', 'PUT']:
-            headers["Content-Type"] = "application/json"
+        # Accept and Authorization headers are carried by the client's session
+        headers = client._json_headers if method_upper in _JSON_BODY_METHODS else None
 
         try:
-            response = requests.request(
+            response = client.session.request(
                 method=method, url=url, headers=headers,
-                params=request_params, json=json, verify=client.verify
+                params=request_params,
+                data=_dumps(json) if json is not None else None
             )
             
-            client.logger.debug(f"Response status: {response.status_code}")
+            if debug_enabled:
+                client.logger.debug(f"Response status: {response.status_code}")
             
-            if response.status_code == 400:
-                try:
-                    error_data = response.json()
-                    # Try validation first
-                    try:
-                        ResponseValidator.validate_response(error_data, client.logger)
-                    except ValidationError as ve:
-                        raise
-                    except:
-                        # Fall back to generic error handling
-                        error_msg = ResponseValidator.extract_error_details(error_data)
-                        raise AssetsError(error_msg)
-                        
-                except ValidationError:
-                    raise
-                except Exception as e:
-                    raise AssetsError(f"Bad request: {str(e)}")
+            # Parse the body exactly once and reuse it below
+            try:
+                body = _loads(response.content) if response.content else None
+            except ValueError:
+                body = None
             
             # For successful responses, log more details for debugging
-            if response.status_code >= 200 and response.status_code < 300:
-                try:
-                    # Try to peek at response content for debugging
-                    response_data = response.json()
-                    if isinstance(response_data, dict):
-                        keys = list(response_data.keys())
-                        client.logger.debug(f"Response contains these keys: {keys}")
-                        
-                        # If this is an object type response, log specific information
-                        if 'id' in response_data:
-                            client.logger.debug(f"Object ID: {response_data['id']}")
-                        if 'name' in response_data:
-                            client.logger.debug(f"Object name: {response_data['name']}")
-                        if 'attributes' in response_data:
-                            client.logger.debug(f"Found {len(response_data['attributes'])} attributes in response")
-                        if 'objectTypeAttributes' in response_data:
-                            client.logger.debug(f"Found {len(response_data['objectTypeAttributes'])} objectTypeAttributes in response")
-                    
-                except Exception:
-                    # Don't fail if we can't parse the JSON for debugging
-                    pass
+            if debug_enabled and 200 <= response.status_code < 300 and isinstance(body, dict):
+                client.logger.debug(f"Response contains these keys: {list(body.keys())}")
+                
+                # If this is an object type response, log specific information
+                if 'id' in body:
+                    client.logger.debug(f"Object ID: {body['id']}")
+                if 'name' in body:
+                    client.logger.debug(f"Object name: {body['name']}")
+                if 'attributes' in body:
+                    client.logger.debug(f"Found {len(body['attributes'])} attributes in response")
+                if 'objectTypeAttributes' in body:
+                    client.logger.debug(f"Found {len(body['objectTypeAttributes'])} objectTypeAttributes in response")
             
             # For debugging errors
-            if response.status_code >= 400:
+            if debug_enabled and response.status_code >= 400:
                 client.logger.debug(f"Response headers: {response.headers}")
-                try:
-                    error_data = response.json()
-                    client.logger.debug(f"Response body: {error_data}")
-                except Exception:
+                if body is not None:
+                    client.logger.debug(f"Response body: {body}")
+                else:
                     client.logger.debug(f"Response raw text: {response.text}")
             
             if response.status_code == 404:
-                if 'object/' in endpoint:
-                    object_id = endpoint.split('/')[-1]
+                if endpoint.startswith(('object/', '/object/')):
+                    object_id = endpoint.rpartition('/')[2]
                     raise AssetNotFoundError(
                         f"Asset with ID '{object_id}' was not found. "
                         "Please verify the ID is correct."
@@ -202,43 +209,48 @@ class BaseHandler:
                 raise AssetNotFoundError("Requested resource was not found")
                 
             if response.status_code == 400:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get('errorMessage', '')
-                    if not error_msg:
-                        if 'errors' in error_data:
-                            # Handle array of errors
-                            error_msgs = []
-                            for err in error_data['errors']:
-                                if isinstance(err, dict):
-                                    error_msgs.append(err.get('message', str(err)))
-                                else:
-                                    error_msgs.append(str(err))
-                            error_msg = " | ".join(error_msgs)
-                        elif 'message' in error_data:
-                            error_msg = error_data['message']
+                if isinstance(body, dict):
+                    errors = body.get('errors')
+                    error_messages = body.get('errorMessages')
+                    if not error_messages and isinstance(errors, dict) and errors:
+                        # Attribute-level errors raise ValidationError with friendly names
+                        ResponseValidator.validate_response(body, client.logger)
+                    
+                    if error_messages:
+                        # Standard Jira error shape, e.g. AQL syntax errors; classified below
+                        if isinstance(error_messages, list):
+                            error_msg = '; '.join(str(message) for message in error_messages)
                         else:
-                            error_msg = f"Bad request: {error_data}"
-                except Exception:
+                            error_msg = str(error_messages)
+                    elif isinstance(errors, list) and errors:
+                        # Handle array of errors
+                        error_msg = " | ".join(
+                            err.get('message', str(err)) if isinstance(err, dict) else str(err)
+                            for err in errors
+                        )
+                    else:
+                        error_msg = (body.get('errorMessage') or body.get('message') or
+                                     ResponseValidator.extract_error_details(body))
+                else:
                     # If we can't parse the JSON, use the raw text
                     error_msg = f"Bad request: {response.text}"
                     
                 client.logger.error(f"API error: {error_msg}")
                 
-                if any(x in error_msg.lower() for x in ['invalid', 'syntax', 'malformed']):
+                tags = {match.lower() for match in _ERR_CLASSIFY.findall(error_msg)}
+                if tags & _QUERY_ERROR_TAGS:
                     raise InvalidQueryError(f"Invalid query: {error_msg}")
-                elif 'schema' in error_msg.lower():
+                elif 'schema' in tags:
                     raise SchemaError(error_msg)
                 else:
                     raise AssetsError(error_msg)
                     
             response.raise_for_status()
-            data = BaseHandler.handle_response(response, client.logger)
+            data = BaseHandler.handle_response(body, response.status_code, client.logger)
             
             # Check for empty results
-            if method.upper() == 'POST' and 'aql' in endpoint:
-                if not data.get('values'):
-                    client.logger.info("No results found")
+            if method_upper == 'POST' and endpoint.endswith('/aql') and not data.get('values'):
+                client.logger.info("No results found")
                     
             return data
             
@@ -247,7 +259,7 @@ class BaseHandler:
             if hasattr(e, 'response') and e.response:
                 client.logger.error(f"Response status: {e.response.status_code}")
                 try:
-                    error_data = e.response.json()
+                    error_data = _loads(e.response.content)
                     if 'errorMessage' in error_data:
                         error_msg = error_data['errorMessage']
                     elif 'message' in error_data:
@@ -263,7 +275,7 @@ class BaseHandler:
             raise
 
     @staticmethod
-    def validate_schema_and_types(client, result: Dict, object_id: Optional[str] = None, types: Optional[List[str]] = None) -> None:
+    def validate_schema_and_types(client: "AssetsClient", result: Dict, object_id: Optional[str] = None, types: Optional[List[str]] = None) -> None:
         """
         Validate that an object belongs to the expected schema and that requested types exist.
         
@@ -276,18 +288,23 @@ class BaseHandler:
         Raises:
             SchemaError: If the object is from a different schema or types don't exist
         """
+        schema_info = client.schema_info
+        
         if types:
-            invalid_types = [t for t in types if t not in client.schema_info['object_types']]
-            if invalid_types:
+            object_types = schema_info['object_types']
+            # Only build the full list of invalid types once one is known to exist
+            if next((t for t in types if t not in object_types), None) is not None:
+                invalid_types = [t for t in types if t not in object_types]
+                available = schema_info.get('object_types_csv') or ', '.join(object_types)
                 raise SchemaError(
-                    f"Invalid object type(s) for schema {client.schema_info['name']}: {', '.join(invalid_types)}\n"
-                    f"Available types: {', '.join(client.schema_info['object_types'].keys())}"
+                    f"Invalid object type(s) for schema {schema_info['name']}: {', '.join(invalid_types)}\n"
+                    f"Available types: {available}"
                 )
         
         if result:
             schema_id = str(result.get('objectType', {}).get('objectSchemaId'))
-            if schema_id != client.schema_info['id']:
+            if schema_id != schema_info['id']:
                 raise SchemaError(
                     f"Object{f' {object_id}' if object_id else ''} belongs to schema {schema_id}, "
-                    f"not to {client.schema_info['name']} ({client.schema_info['id']})"
+                    f"not to {schema_info['name']} ({schema_info['id']})"
                 )
@@ -42,12 +42,18 @@ def discover_schema(client):
     object_types = (types_data if isinstance(types_data, list) 
                    else types_data.get('values', []))
     
+    # Build the name -> ID mapping in a single pass, reading each name once
+    object_types_map = {}
+    for t in object_types:
+        if type(t) is dict:
+            name = t.get('name')
+            if name:
+                object_types_map[name] = str(t.get('id'))
+    
     return {
         'id': str(assets_schema.get('id')),
         'name': assets_schema.get('name'),
-        'object_types': {
-            t.get('name'): str(t.get('id')) 
-            for t in object_types 
-            if isinstance(t, dict) and t.get('name')
-        }
+        'object_types': object_types_map,
+        # Precomputed for error messages listing the available types
+        'object_types_csv': ', '.join(object_types_map)
     }
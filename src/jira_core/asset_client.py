@@ -5,6 +5,7 @@ This module provides the AssetsClient class which implements the core
 functionality for interacting with the Jira Assets API, including
 querying, retrieving, and updating assets.
 """
+import threading
 from typing import Dict, List, Any
 from .client_base import BaseClient
 from .models.asset import Asset
@@ -15,10 +16,14 @@ from .api.workspace_discovery import discover_workspace
 from .api.schema_discovery import discover_schema
 from .api.asset_query import get_objects_aql as get_objects_aql_func
 from .api.asset_retrieval import get_object as get_object_func
+from .api.asset_retrieval import get_objects as get_objects_func
 from .api.asset_update import update_object as update_object_func
 from ..logging.logger import Logger
 import re
 
+# Object type IDs must be sent as strings of digits
+_NUMERIC_RE = re.compile(r'\A\d+\Z')
+
 class AssetsClient(BaseClient):
     """
     Client for interacting with the Jira Assets API.
@@ -36,37 +41,68 @@ class AssetsClient(BaseClient):
             refresh_cache (bool, optional): Whether to force refresh of cached
                 workspace and schema information. Default is False.
         """
+        # Serializes lazy schema discovery between threads sharing this client
+        self._schema_lock = threading.Lock()
         super().__init__(logger=logger)
+        cache_dirty = False
         
         # If refresh_cache is True, force rediscovery of workspace and schema
         if refresh_cache:
             self.logger.debug("Forced cache refresh requested")
             self.workspace_id = None
             self.schema_info = {}
-            self._save_cache()
+            cache_dirty = True
         
         # Use cached workspace_id if available
         if not hasattr(self, 'workspace_id') or not self.workspace_id:
             self.workspace_id = self._discover_workspace()
-            self._save_cache()
+            cache_dirty = True
 
         self.base_url = f"https://api.atlassian.com/jsm/assets/workspace/{self.workspace_id}/v1"
         
-        # Use cached schema_info if available and not forcing refresh
-        if not self.schema_info:
-            self.logger.info("Refreshing schema information from API")
-            self.schema_info = self._discover_schema()
+        # Persist discovered values once; the schema is discovered on first use
+        if cache_dirty:
             self._save_cache()
     
     @property
-    def logger(self):
-        """Get the logger instance."""
-        return self._logger
+    def schema_info(self):
+        """
+        Get the schema information, discovering it on first use.
+        
+        Uses the cached schema information when available. Otherwise the
+        schema is discovered from the API and the cache file is updated.
+        Concurrent first reads wait for a single discovery.
+        
+        Returns:
+            dict: Schema information including schema ID and object types
+        """
+        schema_info = self._schema_info
+        if schema_info:
+            return schema_info
+        with self._schema_lock:
+            # Another thread may have finished discovery while this one waited
+            if not self._schema_info:
+                self.logger.info("Refreshing schema information from API")
+                self._schema_info = self._discover_schema()
+                self._save_cache()
+            return self._schema_info
+
+    @schema_info.setter
+    def schema_info(self, schema_info):
+        """Set the schema information."""
+        self._schema_info = schema_info
 
-    @logger.setter
-    def logger(self, logger):
-        """Set the logger instance."""
-        self._logger = logger
+    def ensure_schema(self):
+        """
+        Make sure schema information is loaded, discovering it if needed.
+        
+        Call this before fanning work out to threads so they share one
+        discovery instead of waiting on it individually.
+        
+        Returns:
+            dict: Schema information including schema ID and object types
+        """
+        return self.schema_info
 
     def _discover_workspace(self):
         """
@@ -120,6 +156,28 @@ class AssetsClient(BaseClient):
             self.logger.error(f"Failed to get object {object_id}: {str(e)}")
             raise
 
+    def get_objects(self, object_ids, max_workers=8):
+        """
+        Retrieve several assets by ID, fetching them concurrently.
+        
+        Args:
+            object_ids (iterable): The IDs of the assets to retrieve
+            max_workers (int, optional): Maximum number of concurrent requests. Default is 8.
+            
+        Returns:
+            list: Asset objects in the same order as object_ids
+            
+        Raises:
+            AssetNotFoundError: When any of the assets doesn't exist
+            SchemaError: When an asset belongs to a different schema
+        """
+        object_ids = list(object_ids)
+        try:
+            return get_objects_func(self, object_ids, max_workers=max_workers)
+        except Exception as e:
+            self.logger.error(f"Failed to get objects {object_ids}: {str(e)}")
+            raise
+
     def get_objects_aql(self, query, start_at=0, max_results=50, include_attributes=True):
         """
         Execute AQL query to retrieve assets.
@@ -196,20 +254,15 @@ class AssetsClient(BaseClient):
         self.logger.debug(f"Creating new asset of type {object_type_id} with attributes")
         
         # Check if object_type_id is a numeric ID or a name
-        if not str(object_type_id).isdigit() and object_type_id in self.schema_info.get('object_types', {}):
-            # If it's a name that happens to be a key in object_types, get the actual ID
-            actual_id = self.schema_info['object_types'][object_type_id]
-            if isinstance(actual_id, str) and actual_id.isdigit():
-                self.logger.debug(f"Converting object type name '{object_type_id}' to ID '{actual_id}'")
-                object_type_id = actual_id
-        
-        # Ensure objectTypeId is a string (possibly representing a number)
         object_type_id = str(object_type_id)
-        
-        # Validate format before sending
-        if not object_type_id.isdigit():
-            self.logger.error(f"Invalid object type ID: {object_type_id}. The API expects a numeric ID.")
-            raise SchemaError(f"Invalid object type ID: {object_type_id}. The API expects a numeric ID.")
+        if not _NUMERIC_RE.match(object_type_id):
+            # If it's a name that is a key in object_types, get the actual ID
+            actual_id = self.schema_info.get('object_types', {}).get(object_type_id)
+            if not (isinstance(actual_id, str) and _NUMERIC_RE.match(actual_id)):
+                self.logger.error(f"Invalid object type ID: {object_type_id}. The API expects a numeric ID.")
+                raise SchemaError(f"Invalid object type ID: {object_type_id}. The API expects a numeric ID.")
+            self.logger.debug(f"Converting object type name '{object_type_id}' to ID '{actual_id}'")
+            object_type_id = actual_id
         
         # Validate attributes format
         if not attributes or not isinstance(attributes, list):
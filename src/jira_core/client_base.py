@@ -4,14 +4,100 @@ Base client module for Jira Assets API.
 This module provides the BaseClient class which handles authentication,
 caching, and common functionality for the Jira Assets API.
 """
+import atexit
 import os
+import time
 from dotenv import load_dotenv
 from base64 import b64encode
 import certifi
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from src.logging.logger import Logger
 import json
+import pickle
 from pathlib import Path
 
+# Bumped whenever the layout of the pickled cache payload changes
+_CACHE_VERSION = 2
+
+# Errors raised by an unreadable or corrupt cache file
+_CACHE_READ_ERRORS = (OSError, ValueError, EOFError, pickle.UnpicklingError)
+
+# Schema keys filled in per object type after discovery (see asset_update.update_object);
+# they are never written to or read back from the site-wide cache file
+_TRANSIENT_SCHEMA_KEYS = frozenset(('attribute_definitions',))
+
+
+def _cache_snapshot(workspace_id, schema_info):
+    """
+    Build the payload saved to the cache file.
+    
+    Copies schema_info without its per-object-type keys, so changes made
+    to the live dict after this call never reach the file.
+    
+    Args:
+        workspace_id: The discovered workspace ID
+        schema_info: The discovered schema information, or None
+        
+    Returns:
+        dict: The versioned cache payload
+    """
+    if isinstance(schema_info, dict):
+        schema_info = {key: value for key, value in schema_info.items()
+                       if key not in _TRANSIENT_SCHEMA_KEYS}
+    return {
+        'version': _CACHE_VERSION,
+        'workspace_id': workspace_id,
+        'schema_info': schema_info
+    }
+
+# Cache payloads saved but not yet written, in save order: site_name -> (cache file, payload).
+# Only the latest snapshot per site is kept, and no client is held alive until exit.
+_pending_flush = {}
+
+
+def _write_cache(site_name, cache_file, cache):
+    """
+    Write a cache payload to disk.
+    
+    The write is skipped when the payload matches what was last loaded or
+    saved for the site in this process.
+    
+    Args:
+        site_name: Jira site the cache belongs to
+        cache_file: Path of the cache file
+        cache: The versioned cache payload
+    """
+    payload = pickle.dumps(cache, protocol=5)
+    cache_hash = hash(payload)
+    memo = BaseClient._cache_memo.get(site_name)
+    if memo and memo[2] == cache_hash:
+        return
+        
+    # Write to a temporary file and swap it in so concurrent clients
+    # never read a partially written cache
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, cache_file)
+    BaseClient._cache_memo[site_name] = (cache_file.stat().st_mtime, payload, cache_hash)
+
+
+@atexit.register
+def _flush_pending_caches():
+    while _pending_flush:
+        site_name = next(iter(_pending_flush))
+        _write_cache(site_name, *_pending_flush.pop(site_name))
+
+# Prefer orjson for reading the legacy JSON cache, falling back to the stdlib codec
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class BaseClient:
     """
     Base client for Jira Assets API interactions.
@@ -19,6 +105,13 @@ class BaseClient:
     This class handles authentication, configuration loading from environment
     variables, and caching of workspace and schema information.
     """
+    # Maximum age of the workspace/schema cache file before it is rediscovered
+    CACHE_TTL = 24 * 60 * 60  # seconds
+    
+    # Cache file contents shared across instances: site_name -> (mtime, pickled payload, hash).
+    # The bytes are kept rather than the parsed dict so each client unpickles its own copy.
+    _cache_memo = {}
+
     def __init__(self, logger=None):
         """
         Initialize a new BaseClient instance.
@@ -27,7 +120,7 @@ class BaseClient:
             logger: Optional Logger instance. If not provided, a new one will be created.
         """
         self.logger = logger or Logger()
-        self.schema_info = None  # Will be populated with schema ID and object types
+        self._schema_info = None  # Will be populated with schema ID and object types
         load_dotenv()
         self.email = os.getenv('JIRA_EMAIL')
         self.api_token = os.getenv('JIRA_API_TOKEN')
@@ -36,45 +129,158 @@ class BaseClient:
         credentials = f"{self.email}:{self.api_token}"
         self.basic_auth = b64encode(credentials.encode()).decode()
         
+        # Request headers built once and reused for every API call
+        self._base_headers = {"Accept": "application/json", "Authorization": "Basic " + self.basic_auth}
+        self._json_headers = {**self._base_headers, "Content-Type": "application/json"}
+        
         self.base_url = None
         
         # Use certifi's built-in certificate bundle
         self.verify = certifi.where()
         
+        # Shared HTTP session so requests reuse pooled keep-alive TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self._base_headers)
+        # Advertise every codec urllib3 can decode (br once brotli is installed)
+        # so large AQL pages are transferred compressed
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self.session.verify = self.verify
+        # Retry transient failures on the warm connection, honouring Retry-After.
+        # POST is not retried so object creation is never replayed, and the
+        # final response is returned (not raised) so normal error handling applies.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            allowed_methods=frozenset(("GET", "PUT", "DELETE"))
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        
         self.cache_dir = Path.home() / '.assets_api_cache'
         self.cache_dir.mkdir(exist_ok=True)
         self._load_cache()
 
+    @property
+    def schema_info(self):
+        """Get the cached schema information."""
+        return self._schema_info
+
+    @schema_info.setter
+    def schema_info(self, schema_info):
+        """Set the schema information."""
+        self._schema_info = schema_info
+
+    def close(self):
+        """
+        Flush pending cache changes, then close the HTTP session and
+        release its pooled connections.
+        """
+        self.flush_cache()
+        self.session.close()
+
+    def __enter__(self):
+        """Allow the client to be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the HTTP session when leaving the context."""
+        self.close()
+
+    def _cache_file(self, suffix='pkl'):
+        """
+        Get the path of this site's cache file.
+        
+        Args:
+            suffix (str, optional): File extension. Default is 'pkl'; 'json'
+                is the legacy format migrated on first read.
+                
+        Returns:
+            Path: The cache file path
+        """
+        return self.cache_dir / f'{self.site_name}_cache.{suffix}'
+
     def _load_cache(self):
         """
         Load cached workspace and schema data.
         
         Attempts to load workspace ID and schema information from a local
-        cache file. If the file doesn't exist or can't be read, the
-        cache values remain None.
+        cache file. If the file doesn't exist, can't be read or is older
+        than CACHE_TTL, the cache values remain None. Cache file contents
+        are memoized per site for the lifetime of the process and reused,
+        without a file read, while the file's modification time is unchanged. A legacy JSON
+        cache is read once and rewritten in the pickle format.
         """
-        cache_file = self.cache_dir / f'{self.site_name}_cache.json'
-        if cache_file.exists():
+        cache_file = self._cache_file()
+        legacy = False
+        try:
+            mtime = cache_file.stat().st_mtime
+        except OSError:
+            cache_file = self._cache_file('json')
             try:
-                with open(cache_file) as f:
-                    cache = json.load(f)
-                    self.workspace_id = cache.get('workspace_id')
-                    self.schema_info = cache.get('schema_info')
-            except:
-                self.workspace_id = None
-                self.schema_info = None
+                mtime = cache_file.stat().st_mtime
+            except OSError:
+                return
+            legacy = True
+            
+        if time.time() - mtime > self.CACHE_TTL:
+            self.logger.debug("Cache file has expired, workspace and schema will be rediscovered")
+            return
+            
+        memo = BaseClient._cache_memo.get(self.site_name)
+        memo_hit = not legacy and memo is not None and memo[0] == mtime
+        try:
+            if memo_hit:
+                payload = memo[1]
+            else:
+                with open(cache_file, 'rb') as f:
+                    payload = f.read()
+            cache = _json_loads(payload) if legacy else pickle.loads(payload)
+        except _CACHE_READ_ERRORS:
+            cache = None
+        if not isinstance(cache, dict) or (not legacy and cache.get('version') != _CACHE_VERSION):
+            self.workspace_id = None
+            self._schema_info = None
+            return
+        if not legacy and not memo_hit:
+            BaseClient._cache_memo[self.site_name] = (mtime, payload, hash(payload))
+            
+        self.workspace_id = cache.get('workspace_id')
+        self._schema_info = cache.get('schema_info')
+        if isinstance(self._schema_info, dict) and not _TRANSIENT_SCHEMA_KEYS.isdisjoint(self._schema_info):
+            # Files written before these keys were excluded may still carry them
+            self._schema_info = {key: value for key, value in self._schema_info.items()
+                                 if key not in _TRANSIENT_SCHEMA_KEYS}
+        
+        if legacy:
+            self.logger.debug("Migrating JSON cache file to the pickle format")
+            self._save_cache()
+            self.flush_cache()
+            cache_file.unlink(missing_ok=True)
 
     def _save_cache(self):
         """
-        Save workspace and schema data to cache.
+        Snapshot workspace and schema data to be saved.
+        
+        The data is copied now, right after discovery, but the cache file
+        is written by flush_cache(), which runs on close() and at
+        interpreter exit, so discovery never blocks on disk I/O.
+        """
+        snapshot = _cache_snapshot(self.workspace_id, self._schema_info)
+        # Re-insert so the site moves to the end of the save order
+        _pending_flush.pop(self.site_name, None)
+        _pending_flush[self.site_name] = (self._cache_file(), snapshot)
+
+    def flush_cache(self):
+        """
+        Write pending workspace and schema data to the cache file.
         
-        Saves the current workspace ID and schema information to a local
-        cache file for faster initialization in subsequent runs.
+        Saves the latest snapshot taken by _save_cache() for this client's
+        site to a local cache file for faster initialization in subsequent
+        runs. Does nothing if there are no pending changes, and the write is
+        skipped when the data is unchanged since it was last loaded or saved.
         """
-        cache_file = self.cache_dir / f'{self.site_name}_cache.json'
-        cache = {
-            'workspace_id': self.workspace_id,
-            'schema_info': self.schema_info
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(cache, f)
+        pending = _pending_flush.pop(self.site_name, None)
+        if pending is not None:
+            _write_cache(self.site_name, *pending)
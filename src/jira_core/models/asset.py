@@ -4,8 +4,27 @@ Asset model module for Jira Assets API.
 This module defines the Asset class which represents a Jira asset with
 its attributes and provides methods to process and extract asset data.
 """
-from typing import Any, Dict, Optional
-from .attribute_mapper import AttributeMapper
+from typing import Any, Dict, List, Optional, Union
+from .attribute_mapper import get_mapper
+
+
+def _dict_or_none(value: Any) -> Optional[List[Dict[str, Any]]]:
+    return [value] if isinstance(value, dict) else None
+
+
+def _list_or_none(value: Any) -> Optional[List[Dict[str, Any]]]:
+    return value if isinstance(value, list) else None
+
+
+# Attribute value layouts in lookup order; an extractor returning None
+# means the key was present but unusable, so the next layout is tried.
+_VALUE_KEYS = (
+    ('objectAttributeValues', lambda value: value),
+    ('value', lambda value: [{'value': value}]),
+    ('attributeValue', _dict_or_none),
+    ('attributeValues', _list_or_none),
+)
+
 
 class Asset:
     """
@@ -15,10 +34,15 @@ class Asset:
     methods to access and transform this data. It uses a shared AttributeMapper
     to resolve attribute names from IDs.
     """
-    # Create class-level mapper that's shared across all instances
-    _mapper = AttributeMapper()
+    __slots__ = ('id', 'name', 'object_key', 'object_type', 'created',
+                 'updated', 'attributes', '_raw_data')
+
+    # Process-wide mapper shared across all instances
+    _mapper = get_mapper()
     
-    def __init__(self, data: Dict[str, Any], attribute_definitions=None):
+    def __init__(self, data: Dict[str, Any],
+                 attribute_definitions: Optional[Dict[str, str]] = None,
+                 keep_raw: bool = False) -> None:
         """
         Initialize a new Asset instance from API response data.
         
@@ -26,6 +50,9 @@ class Asset:
             data (dict): The raw asset data from the API response
             attribute_definitions (dict, optional): Additional attribute definitions
                 to update the mapper cache
+            keep_raw (bool, optional): Whether to retain the raw API data after
+                processing. Default is False so large result sets are not
+                held in memory twice.
         """
         self.id = str(data.get('id', ''))
         self.name = data.get('name', '')
@@ -35,19 +62,67 @@ class Asset:
         self.updated = data.get('updated', '')
         
         # Get attributes either from top-level or nested in objectTypeAttributes
-        attributes = data.get('attributes', [])
-        if not attributes and 'objectTypeAttributes' in data:
-            attributes = data.get('objectTypeAttributes', [])
+        attributes = data.get('attributes') or data.get('objectTypeAttributes') or []
         
         # Update the class-level mapper's definitions if provided
         if attribute_definitions:
-            Asset._mapper._definition_cache.update(attribute_definitions)
-            Asset._mapper.trim_cache()  # Call trim_cache after updating the cache
+            Asset._mapper.update_definitions(attribute_definitions)
             
         self.attributes = self._process_attributes(attributes)
-        self._raw_data = data
+        self._raw_data = data if keep_raw else None
+
+    @property
+    def raw_data(self) -> Dict[str, Any]:
+        """
+        Get the raw API data this asset was built from.
+        
+        Returns:
+            dict: The raw asset data
+            
+        Raises:
+            RuntimeError: If the asset was constructed without keep_raw
+        """
+        if self._raw_data is None:
+            raise RuntimeError("raw data was not retained; construct with keep_raw=True")
+        return self._raw_data
+
+    @classmethod
+    def from_response(cls, objects: List[Dict[str, Any]],
+                      attribute_definitions: Optional[Dict[str, str]] = None,
+                      logger=None, keep_raw: bool = False) -> List["Asset"]:
+        """
+        Build Asset instances for a page of API results.
+        
+        Updates the shared mapper with the attribute definitions once for
+        the whole page instead of once per asset.
+        
+        Args:
+            objects (list): Raw asset data from the API response
+            attribute_definitions (dict, optional): Attribute definitions
+                to update the mapper cache with
+            logger (Logger, optional): If given, objects that cannot be
+                converted are logged and skipped instead of raising
+            keep_raw (bool, optional): Whether each Asset retains its raw data
+                
+        Returns:
+            list: The constructed Asset instances
+        """
+        if attribute_definitions:
+            cls._mapper.update_definitions(attribute_definitions)
+        if logger is None:
+            return [cls(data, keep_raw=keep_raw) for data in objects]
+            
+        assets = []
+        for data in objects:
+            try:
+                assets.append(cls(data, keep_raw=keep_raw))
+            except Exception as e:
+                # Continue processing other assets even if one fails
+                logger.error(f"Error creating Asset object from response: {str(e)}")
+        return assets
 
-    def _process_attributes(self, attributes):
+    def _process_attributes(self, attributes: List[Dict[str, Any]]
+                            ) -> Dict[str, Union[str, List[str], None]]:
         """
         Process raw attribute data into a structured format.
         
@@ -60,26 +135,29 @@ class Asset:
         Returns:
             dict: Processed attributes with names as keys and processed values as values
         """
-        processed = {}
+        processed: Dict[str, Union[str, List[str], None]] = {}
+        get_name = self._mapper.get_attribute_name
+        extract_values = self._extract_values
+        extract = self._extract_single_value
         for attr in attributes:
-            name = self._mapper.get_attribute_name(attr)
+            name = get_name(attr)
             if not name:
                 continue
                 
-            values = self._extract_values(attr)
+            values = extract_values(attr)
             if not values:
                 processed[name] = None
                 continue
                 
             # Single value processing
             if len(values) == 1:
-                processed[name] = self._extract_single_value(values[0])
+                processed[name] = extract(values[0])
             else:
-                processed[name] = [self._extract_single_value(v) for v in values]
+                processed[name] = [extract(v) for v in values]
                 
         return processed
     
-    def _extract_values(self, attr):
+    def _extract_values(self, attr: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extract values from attribute data.
         
@@ -91,17 +169,14 @@ class Asset:
         Returns:
             list: List of value objects extracted from the attribute
         """
-        if 'objectAttributeValues' in attr:
-            return attr['objectAttributeValues']
-        if 'value' in attr:
-            return [{'value': attr['value']}]
-        if isinstance(attr.get('attributeValue'), dict):
-            return [attr['attributeValue']]
-        if isinstance(attr.get('attributeValues'), list):
-            return attr['attributeValues']
+        for key, extractor in _VALUE_KEYS:
+            if key in attr:
+                values = extractor(attr[key])
+                if values is not None:
+                    return values
         return []
     
-    def _extract_single_value(self, value):
+    def _extract_single_value(self, value: Dict[str, Any]) -> str:
         """
         Extract a single value from a value object.
         
@@ -113,10 +188,12 @@ class Asset:
         Returns:
             str: The extracted value as a string
         """
-        if 'referencedObject' in value:
-            return value['referencedObject'].get('name', '')
-        if 'status' in value:
-            return value.get('status', {}).get('name', '')
+        referenced = value.get('referencedObject')
+        if referenced is not None:
+            return referenced.get('name', '')
+        status = value.get('status')
+        if status is not None:
+            return status.get('name', '')
         return (value.get('value') or 
                 value.get('displayValue') or 
                 value.get('searchValue', ''))
@@ -134,7 +211,7 @@ class Asset:
         """
         return self.attributes.get(name, default)
 
-    def to_dict(self):
+    def to_dict(self) -> Dict[str, Any]:
         """
         Convert the asset to a dictionary representation.
         
@@ -4,8 +4,38 @@ Attribute Mapper module for Jira Assets API.
 This module provides functionality to map attribute IDs to their names
 and maintains a cache to optimize performance during attribute lookups.
 """
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
 from src.logging.logger import Logger
 
+# Shared empty mapping used as a default for missing nested dicts
+_EMPTY: Dict[str, Any] = {}
+
+# Keys that may hold attribute definitions in a dict response
+_ATTRIBUTE_KEYS = ('objectTypeAttributes', 'objecttypeattributes', 'attributes')
+
+# ID values that cannot identify an attribute definition
+_MISSING_IDS = (None, '')
+
+
+def _collect_definitions(attributes: List[Any]) -> Dict[str, str]:
+    """
+    Map attribute IDs to names for every entry that has both.
+    
+    Args:
+        attributes (list): Raw attribute definitions from the API
+        
+    Returns:
+        dict: A dictionary mapping attribute IDs to their names
+    """
+    return {
+        str(attr['id']): attr['name']
+        for attr in attributes
+        if type(attr) is dict and attr.get('id') not in _MISSING_IDS and attr.get('name')
+    }
+
 
 class AttributeMapper:
     """
@@ -14,15 +44,16 @@ class AttributeMapper:
     This class builds and maintains a cache of attribute definitions from API responses
     and provides methods to look up attribute names by various identifiers.
     """
-    def __init__(self):
+    def __init__(self) -> None:
         """
         Initialize a new AttributeMapper with an empty cache.
         """
-        self._definition_cache = {}
+        self._definition_cache: "OrderedDict[str, str]" = OrderedDict()
         self.logger = Logger()
         self._cache_limit = 1000  # Limit cache size
+        self._lock = threading.Lock()  # Guards cache mutation across threads
     
-    def build_definitions(self, response_data):
+    def build_definitions(self, response_data: Any) -> Dict[str, str]:
         """
         Build attribute definitions from API response data.
         
@@ -35,42 +66,51 @@ class AttributeMapper:
         Returns:
             dict: A dictionary mapping attribute IDs to their names
         """
-        definitions = {}
+        definitions: Dict[str, str] = {}
         
         # Handle list response (from direct attributes endpoint)
         if isinstance(response_data, list):
-            for attr in response_data:
-                if isinstance(attr, dict):
-                    attr_id = str(attr.get('id', ''))
-                    attr_name = attr.get('name', '')
-                    if attr_id and attr_name:
-                        definitions[attr_id] = attr_name
-            
-            # If we got definitions, update cache and return
-            if definitions:
-                self._definition_cache.update(definitions)
-                self.trim_cache()
-                return definitions
+            definitions = _collect_definitions(response_data)
         
         # Handle dict response
-        if isinstance(response_data, dict):
+        elif isinstance(response_data, dict):
             # Check different possible locations for attributes
-            for attr_key in ['objectTypeAttributes', 'objecttypeattributes', 'attributes']:
-                if attr_key in response_data and not definitions:
-                    for attr in response_data[attr_key]:
-                        attr_id = str(attr.get('id', ''))
-                        attr_name = attr.get('name', '')
-                        if attr_id and attr_name:
-                            definitions[attr_id] = attr_name
+            for attr_key in _ATTRIBUTE_KEYS:
+                if attr_key in response_data:
+                    definitions = _collect_definitions(response_data[attr_key])
+                    if definitions:
+                        break
         
         # Update cache with what we found
         if definitions:
-            self._definition_cache.update(definitions)
-            self.trim_cache()
+            self.update_definitions(definitions)
         
         return definitions
     
-    def get_attribute_name(self, attr):
+    def update_definitions(self, definitions: Dict[str, str]) -> None:
+        """
+        Add attribute definitions to the cache, evicting the oldest if needed.
+        
+        Updated entries are marked as most recently used so that eviction
+        removes the least recently refreshed definitions first. IDs and
+        names are interned, so every Asset keys its attributes with the
+        same string objects.
+        
+        Args:
+            definitions (dict): Mapping of attribute IDs to their names
+        """
+        cache = self._definition_cache
+        intern = sys.intern
+        with self._lock:
+            for attr_id, attr_name in definitions.items():
+                attr_id = intern(attr_id)
+                cache[attr_id] = intern(attr_name)
+                cache.move_to_end(attr_id)
+            trimmed = self._evict()
+        if trimmed:
+            self.logger.debug(f"Trimmed attribute definition cache to {len(cache)} items")
+    
+    def get_attribute_name(self, attr: Dict[str, Any]) -> str:
         """
         Get attribute name from attribute data.
         
@@ -86,39 +126,66 @@ class AttributeMapper:
             str: The attribute name or ID if name couldn't be determined
         """
         # Try direct name first
-        name = (attr.get('objectTypeAttribute', {}).get('name') or 
-               attr.get('name'))
+        type_attr = attr.get('objectTypeAttribute') or _EMPTY
+        name = type_attr.get('name') or attr.get('name')
         if name:
             return name
             
-        # Try ID lookup
-        attr_id = str(attr.get('objectTypeAttributeId', ''))
-        if attr_id in self._definition_cache:
-            return self._definition_cache[attr_id]
-            
-        # Fallback to other ID fields
-        attr_id = (attr.get('objectTypeAttribute', {}).get('id') or 
-                  attr.get('id') or
-                  attr_id)
+        # Resolve the first available ID field and look it up in the cache
+        attr_id = attr.get('objectTypeAttributeId') or type_attr.get('id') or attr.get('id')
+        if not attr_id:
+            return ''
+        if type(attr_id) is not str:
+            attr_id = str(attr_id)
         return self._definition_cache.get(attr_id, attr_id)
     
-    def clear_cache(self):
+    def clear_cache(self) -> None:
         """
         Clear the attribute definition cache.
         
         Removes all cached attribute definitions to free memory or force fresh lookups.
         """
-        self._definition_cache.clear()
+        with self._lock:
+            self._definition_cache.clear()
         
-    def trim_cache(self):
+    def trim_cache(self) -> None:
         """
         Trim the cache if it exceeds the size limit.
         
-        Keeps only the most recent half of the cached items if the cache
-        exceeds the configured size limit.
+        Evicts the least recently updated definitions, one at a time,
+        until the cache is back within the configured size limit.
         """
-        if len(self._definition_cache) > self._cache_limit:
-            # Keep the most recent half of the items
-            items = list(self._definition_cache.items())
-            self._definition_cache = dict(items[-self._cache_limit//2:])
+        with self._lock:
+            trimmed = self._evict()
+        if trimmed:
             self.logger.debug(f"Trimmed attribute definition cache to {len(self._definition_cache)} items")
+    
+    def _evict(self) -> bool:
+        """
+        Evict the oldest definitions until the cache is within its limit.
+        
+        The caller must hold ``self._lock``.
+        
+        Returns:
+            bool: True if any definitions were evicted
+        """
+        cache = self._definition_cache
+        if len(cache) <= self._cache_limit:
+            return False
+        while len(cache) > self._cache_limit:
+            cache.popitem(last=False)
+        return True
+
+
+# Process-wide mapper shared by every Asset
+_GLOBAL_MAPPER = AttributeMapper()
+
+
+def get_mapper() -> AttributeMapper:
+    """
+    Get the process-wide attribute mapper.
+    
+    Returns:
+        AttributeMapper: The shared mapper instance
+    """
+    return _GLOBAL_MAPPER
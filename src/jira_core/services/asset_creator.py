@@ -4,13 +4,30 @@ Asset creation service for Jira Assets API.
 This module provides the AssetCreator class which implements business logic
 for creating assets in the Jira Assets API, including proper attribute formatting.
 """
-from typing import Dict, List, Any, Optional
+import logging
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from ...jira_core.asset_client import AssetsClient
 from ...logging.logger import Logger
 from ...jira_core.models.attribute_mapper import AttributeMapper
 from ...jira_core.api.base_handler import BaseHandler
 from ...jira_core.api.attribute_discovery import get_object_type_attributes, get_attributes_from_sample_object
 
+# Common standardized attribute names and the variations users type for them
+_COMMON_ATTRIBUTE_VARIATIONS: Dict[str, Tuple[str, ...]] = {
+    'name': ('name', 'title', 'asset name'),
+    'serial number': ('serial', 'serialnumber', 'serial number', 'serialnum'),
+    'status': ('status', 'state', 'condition'),
+    'model': ('model', 'device model'),
+    'manufacturer': ('manufacturer', 'vendor', 'make'),
+}
+
+# Each variation mapped to the full set of variations for its attribute
+_VARIATION_TO_CANONICAL: Dict[str, Tuple[str, ...]] = {
+    variation: variations
+    for variations in _COMMON_ATTRIBUTE_VARIATIONS.values()
+    for variation in variations
+}
+
 class AssetCreator:
     """
     Handles asset creation according to business rules.
@@ -32,6 +49,13 @@ class AssetCreator:
         self.logger = logger or Logger.configure()
         # Initialize attribute mapper for dynamic attribute ID discovery
         self.attribute_mapper = AttributeMapper()
+        # Discovered attribute name -> ID maps, keyed by object type ID
+        self._attr_cache: Dict[str, Dict[str, Any]] = {}
+        # Resolved attribute name -> ID (or None), keyed by object type ID
+        self._resolved_attr_ids: Dict[str, Dict[str, Optional[str]]] = {}
+        # Lowercase object type name -> ID index and the object_types it was built from
+        self._type_name_to_id: Optional[Dict[str, str]] = None
+        self._type_index_source = None
     
     def create_asset(self, object_type_name: str, attributes_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -52,13 +76,14 @@ class AssetCreator:
                 return None
             
             # Format attributes for API call
-            formatted_attributes = self._format_attributes_for_api(object_type_name, attributes_dict)
+            formatted_attributes = self._format_attributes_for_api(object_type_id, object_type_name, attributes_dict)
             if not formatted_attributes:
                 self.logger.error(f"Failed to format attributes for object type '{object_type_name}'")
                 return None
                 
             # Create the asset
-            self.logger.debug(f"Sending create request with type ID: {object_type_id}, attributes: {formatted_attributes}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Sending create request with type ID: {object_type_id}, attributes: {formatted_attributes}")
             result = self.client.create_object(object_type_id, formatted_attributes)
             
             # Ensure result is a dictionary
@@ -93,26 +118,21 @@ class AssetCreator:
             self.logger.debug(f"Available schema keys: {list(schema_info.keys())}")
             return None
         
-        # First, check if object_type_name is directly an ID in the schema
+        # First, check if object_type_name is directly a key in the schema
         if object_type_name in object_types:
+            value = object_types[object_type_name]
+            if isinstance(value, str) and value.isdigit():
+                # Name keyed to its numeric ID
+                self.logger.debug(f"Found object type ID: {value} for {object_type_name}")
+                return value
             self.logger.debug(f"Object type '{object_type_name}' is a direct ID match")
             return object_type_name
         
         # Try case-insensitive match against names
-        object_type_name_lower = object_type_name.lower()
-        
-        # Handle both dictionary and string type values
-        for type_id, type_info in object_types.items():
-            # If type_info is a dictionary with a 'name' key
-            if isinstance(type_info, dict) and 'name' in type_info:
-                name = type_info['name'].lower()
-                if name == object_type_name_lower:
-                    self.logger.debug(f"Found object type '{object_type_name}' with ID {type_id}")
-                    return type_id
-            # If type_info is directly a string (the name)
-            elif isinstance(type_info, str) and type_info.lower() == object_type_name_lower:
-                self.logger.debug(f"Found object type '{object_type_name}' with ID {type_id}")
-                return type_id
+        type_id = self._ensure_type_index(object_types).get(object_type_name.lower())
+        if type_id is not None:
+            self.logger.debug(f"Found object type '{object_type_name}' with ID {type_id}")
+            return type_id
         
         # Log available types to help with troubleshooting
         available_types = []
@@ -127,12 +147,38 @@ class AssetCreator:
         sample_types = available_types[:10]
         self.logger.error(f"Object type '{object_type_name}' not found. Sample available types: {', '.join(sample_types)}")
         
-        if len(available_types) > 10:
+        if len(available_types) > 10 and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"All available types: {', '.join(available_types)}")
         
         return None
     
-    def _format_attributes_for_api(self, object_type_name: str, attributes_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _ensure_type_index(self, object_types: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Get the lowercase name to ID index for the schema's object types.
+        
+        The index is built once and rebuilt only when the schema's
+        object_types mapping is replaced, e.g. after a schema refresh.
+        
+        Args:
+            object_types (Dict[str, Any]): The schema's object types
+            
+        Returns:
+            Dict[str, str]: Mapping of lowercase object type names to IDs
+        """
+        if self._type_name_to_id is None or self._type_index_source is not object_types:
+            index = {}
+            for type_id, type_info in object_types.items():
+                # type_info is either a dictionary with a 'name' key or the name itself
+                if isinstance(type_info, dict) and 'name' in type_info:
+                    index.setdefault(type_info['name'].lower(), type_id)
+                elif isinstance(type_info, str):
+                    index.setdefault(type_info.lower(), type_id)
+            self._type_name_to_id = index
+            self._type_index_source = object_types
+        return self._type_name_to_id
+    
+    def _format_attributes_for_api(self, object_type_id: str, object_type_name: str,
+                                   attributes_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Format attributes for the API call according to Jira Assets API requirements.
         
@@ -147,37 +193,13 @@ class AssetCreator:
         ]
         
         Args:
-            object_type_name (str): The name of the object type
+            object_type_id (str): The resolved ID of the object type
+            object_type_name (str): The name of the object type, used for logging
             attributes_dict (Dict[str, Any]): Dictionary of attribute names and values
             
         Returns:
             List[Dict[str, Any]]: Formatted attributes for the API
         """
-        schema_info = self.client.schema_info
-        if not schema_info:
-            self.logger.error("Schema information is empty")
-            return []
-            
-        object_types = schema_info.get('object_types', {})
-        
-        # Get the object type ID
-        object_type_id = None
-        if object_type_name in object_types:
-            # Direct match
-            value = object_types[object_type_name]
-            if isinstance(value, str) and value.isdigit():
-                object_type_id = value
-                self.logger.debug(f"Found object type ID: {object_type_id} for {object_type_name}")
-            else:
-                self.logger.debug(f"Object type match found but value is not a numeric ID: {value}")
-        
-        if not object_type_id:
-            # Try to get the ID using the regular method
-            object_type_id = self._get_object_type_id(object_type_name)
-            if not object_type_id:
-                self.logger.error(f"Could not determine a valid ID for object type '{object_type_name}'")
-                return []
-        
         # Ensure we have required attributes
         if len(attributes_dict) == 0:
             self.logger.error("No attributes provided")
@@ -188,33 +210,29 @@ class AssetCreator:
         if not object_type_attributes:
             self.logger.warning(f"No attribute definitions found for object type {object_type_name} ({object_type_id})")
         
-        # Format attributes strictly according to the API documentation format
-        formatted_attributes = []
-        
-        for attr_name, attr_value in attributes_dict.items():
-            # Try to map attribute name to its ID for this specific object type
-            attr_id = self._find_attribute_id(attr_name, object_type_attributes)
-            
-            if attr_id:
-                self.logger.debug(f"Found attribute ID '{attr_id}' for '{attr_name}' in object type {object_type_name}")
-            else:
+        # Map every attribute name to its ID for this specific object type
+        resolved = self._resolve_attribute_ids(object_type_id, attributes_dict, object_type_attributes)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        for attr_name, attr_id in resolved.items():
+            if not attr_id:
+                # Attributes we don't have mappings for are skipped
                 self.logger.warning(f"No mapping found for attribute '{attr_name}' in object type '{object_type_name}'")
-                # Skip attributes we don't have mappings for
-                continue
-            
-            # Format the attribute according to API documentation format
-            formatted_attribute = {
+            elif debug_enabled:
+                self.logger.debug(f"Found attribute ID '{attr_id}' for '{attr_name}' in object type {object_type_name}")
+        
+        # Format attributes strictly according to the API documentation format
+        formatted_attributes = [
+            {
                 "objectTypeAttributeId": str(attr_id),
-                "objectAttributeValues": [
-                    {
-                        "value": str(attr_value)
-                    }
-                ]
+                "objectAttributeValues": [{"value": str(attributes_dict[attr_name])}]
             }
-            formatted_attributes.append(formatted_attribute)
+            for attr_name, attr_id in resolved.items()
+            if attr_id
+        ]
         
         # Log the final formatted attributes
-        self.logger.debug(f"Formatted attributes: {formatted_attributes}")
+        if debug_enabled:
+            self.logger.debug(f"Formatted attributes: {formatted_attributes}")
         
         if not formatted_attributes:
             self.logger.warning(f"No valid attribute mappings found for object type '{object_type_name}'")
@@ -225,6 +243,33 @@ class AssetCreator:
         """
         Discover attribute definitions for a specific object type.
         
+        Successful discoveries are cached per object type, so creating many
+        assets of the same type only queries the API once. Empty results
+        are not cached and are retried on the next call.
+        
+        Args:
+            object_type_id: The ID of the object type
+            
+        Returns:
+            Dict[str, Any]: Mapping of attribute names to their IDs
+        """
+        object_type_id = str(object_type_id)
+        attribute_map = self._attr_cache.get(object_type_id)
+        if attribute_map:
+            return attribute_map
+            
+        attribute_map = self._fetch_object_type_attributes(object_type_id)
+        if attribute_map:
+            self._attr_cache[object_type_id] = attribute_map
+        return attribute_map
+
+    def _fetch_object_type_attributes(self, object_type_id: str) -> Dict[str, Any]:
+        """
+        Fetch attribute definitions for an object type from the API.
+        
+        Tries the attributes endpoint, then a sample object, and finally
+        the schema definition.
+        
         Args:
             object_type_id: The ID of the object type
             
@@ -269,12 +314,14 @@ class AssetCreator:
                     
                     # Look for attributes
                     attributes = obj_type.get('attributes', [])
+                    debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
                     for attr in attributes:
                         attr_id = str(attr.get('id', ''))
                         attr_name = attr.get('name', '')
                         if attr_id and attr_name:
                             attribute_map[attr_name.lower()] = attr_id
-                            self.logger.debug(f"Found attribute in schema: {attr_name} -> {attr_id}")
+                            if debug_enabled:
+                                self.logger.debug(f"Found attribute in schema: {attr_name} -> {attr_id}")
                     
                     break
             
@@ -286,6 +333,34 @@ class AssetCreator:
         self.logger.warning(f"Failed to discover any attributes for object type {object_type_id} using all available methods")
         return {}
 
+    def _resolve_attribute_ids(self, object_type_id: str, attr_names: Iterable[str],
+                               object_type_attributes: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """
+        Resolve attribute names to IDs for an object type.
+        
+        Resolutions are remembered per object type, so the alias and
+        partial-match fallbacks run once per distinct name rather than
+        once per created asset.
+        
+        Args:
+            object_type_id: The ID of the object type
+            attr_names: The attribute names to resolve
+            object_type_attributes: Mapping of attribute names to IDs
+            
+        Returns:
+            Dict[str, Optional[str]]: Each name mapped to its ID, or None if unmapped
+        """
+        if not object_type_attributes:
+            return {attr_name: None for attr_name in attr_names}
+            
+        known = self._resolved_attr_ids.setdefault(str(object_type_id), {})
+        resolved = {}
+        for attr_name in attr_names:
+            if attr_name not in known:
+                known[attr_name] = self._find_attribute_id(attr_name, object_type_attributes)
+            resolved[attr_name] = known[attr_name]
+        return resolved
+    
     def _find_attribute_id(self, attr_name: str, object_type_attributes: Dict[str, Any]) -> Optional[str]:
         """
         Find attribute ID by name in the object type attributes.
@@ -302,23 +377,13 @@ class AssetCreator:
         if attr_name_lower in object_type_attributes:
             return object_type_attributes[attr_name_lower]
         
-        # Try common standardized names
-        common_attributes = {
-            'name': ['name', 'title', 'asset name'],
-            'serial number': ['serial', 'serialnumber', 'serial number', 'serialnum'],
-            'status': ['status', 'state', 'condition'],
-            'model': ['model', 'device model'],
-            'manufacturer': ['manufacturer', 'vendor', 'make'],
-        }
-        
         # Check if this attribute name is in our common attribute mappings
-        for common_name, variations in common_attributes.items():
-            if attr_name_lower in variations:
-                # Look for any of the common variations in the attribute map
-                for variation in variations:
-                    if variation in object_type_attributes:
-                        self.logger.debug(f"Mapped '{attr_name}' to common attribute '{variation}'")
-                        return object_type_attributes[variation]
+        variations = _VARIATION_TO_CANONICAL.get(attr_name_lower, ())
+        # Look for any of the common variations in the attribute map
+        for variation in variations:
+            if variation in object_type_attributes:
+                self.logger.debug(f"Mapped '{attr_name}' to common attribute '{variation}'")
+                return object_type_attributes[variation]
         
         # Try partial match as a last resort
         for name, id in object_type_attributes.items():
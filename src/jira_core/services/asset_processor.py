@@ -5,8 +5,13 @@ This module provides the AssetProcessor class which implements business logic
 for processing assets in the Jira Assets system, including recalculation
 of buyout prices and other asset-related operations.
 """
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import cached_property
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from ...logging.logger import Logger
 from ..models.asset import Asset
 from .buyout_calculator import BuyoutCalculator
@@ -33,6 +38,14 @@ class AssetProcessor:
         self.logger = logger or Logger.configure()
         self.force_recalculate = force_recalculate
         self.buyout_calculator = BuyoutCalculator(logger=self.logger)
+        self._supported_types: Dict[str, bool] = {}  # Object type name -> supported for buyout
+    
+    @cached_property
+    def _supported_pattern(self) -> "re.Pattern":
+        """Pattern matching any supported device type within an object type name."""
+        return re.compile(
+            '|'.join(re.escape(t) for t in self.buyout_calculator.TYPE_CATEGORY_MAP)
+        )
         
     def process_asset(self, asset: Asset) -> bool:
         """
@@ -52,19 +65,106 @@ class AssetProcessor:
         Raises:
             ValueError: If the asset doesn't have required attributes
         """
-        self.logger.debug(f"Processing asset {asset.id}")
+        updates = self._prepare_updates(asset)
+        
+        # If we have any updates to make
+        if updates:
+            self._apply_updates(asset, updates)
+        else:
+            self.logger.debug("No updates needed for asset %s", asset.id)
+        return True
+    
+    def process_assets(self, assets: Iterable[Asset], max_workers: int = 8) -> Dict[str, bool]:
+        """
+        Process several assets, sending their updates concurrently.
+        
+        Updates for every asset are computed first. The resulting API
+        updates are then issued from a thread pool over the client's shared
+        HTTP session, so their round trips overlap. Assets repeated in the
+        input are processed once. A failure for one asset is logged and
+        does not stop the others.
+        
+        Args:
+            assets: The assets to process
+            max_workers: Maximum number of concurrent update requests
+            
+        Returns:
+            Dict[str, bool]: Mapping of asset IDs to whether processing succeeded
+        """
+        results = {}
+        pending = []
+        # Count every asset's age up to the same date instead of asking the clock per asset
+        self.buyout_calculator._today = date.today()
+        try:
+            for asset in assets:
+                if asset.id in results:
+                    # The same asset listed twice only needs to be updated once
+                    continue
+                try:
+                    updates = self._prepare_updates(asset)
+                except Exception as e:
+                    self.logger.error("Failed to process asset %s: %s", asset.id, e)
+                    results[asset.id] = False
+                    continue
+                results[asset.id] = True
+                if updates:
+                    pending.append((asset, updates))
+                else:
+                    self.logger.debug("No updates needed for asset %s", asset.id)
+        finally:
+            self.buyout_calculator._today = None
+        
+        if not pending:
+            return results
+        
+        # Resolve the schema once up front rather than racing to discover it in every worker
+        self.client.ensure_schema()
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = [
+                (asset, executor.submit(self._apply_updates, asset, updates))
+                for asset, updates in pending
+            ]
+            for asset, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error("Failed to process asset %s: %s", asset.id, e)
+                    results[asset.id] = False
+        return results
+    
+    def _prepare_updates(self, asset: Asset) -> Dict[str, Any]:
+        """
+        Compute the attribute updates an asset needs.
+        
+        Args:
+            asset: The asset to compute updates for
+            
+        Returns:
+            Dict[str, Any]: Attribute names mapped to their new values; empty
+                if the asset needs no changes
+        """
+        asset_id = asset.id
+        logger = self.logger
+        calculator = self.buyout_calculator
+        logger.debug("Processing asset %s", asset_id)
+        
+        # Read the attributes needed for buyout processing once
+        attrs = asset.attributes
+        object_type = getattr(asset, 'object_type', None)
+        purchase_cost = attrs.get('Purchase Cost')
+        purchase_date = attrs.get('Purchase Date')
         
         # Check if this is a buyout-eligible asset
-        if not self._is_buyout_eligible(asset):
-            self.logger.debug(f"Asset {asset.id} is not eligible for buyout processing")
-            return True
+        if not self._is_buyout_eligible(asset_id, object_type, purchase_cost, purchase_date):
+            logger.debug("Asset %s is not eligible for buyout processing", asset_id)
+            return {}
             
         # Calculate device age
-        purchase_date = asset.attributes.get('Purchase Date')
-        device_age_months = self.buyout_calculator.calculate_months_since_purchase(purchase_date)
+        device_age_months = calculator.calculate_months_since_purchase(purchase_date)
         
         # Calculate buyout price
-        buyout_price = self._calculate_buyout_price(asset)
+        buyout_price = self._calculate_buyout_price(asset_id, object_type, purchase_cost, purchase_date)
         
         # Prepare updates dict
         updates = {}
@@ -72,139 +172,170 @@ class AssetProcessor:
         # Update Device Age if available
         if device_age_months is not None:
             updates['Device Age'] = device_age_months
-            self.logger.debug(f"Setting Device Age for asset {asset.id} to {device_age_months} months")
+            logger.debug("Setting Device Age for asset %s to %s months", asset_id, device_age_months)
         
         # Check if we need to update the buyout price
-        current_buyout = asset.attributes.get('Buyout Price')
+        current_buyout = attrs.get('Buyout Price')
         buyout_price_updated = False
-        if self.buyout_calculator.should_update_buyout_price(
+        if calculator.should_update_buyout_price(
             current_buyout, 
             buyout_price,
             force_update=self.force_recalculate
         ):
-            self.logger.info(f"Updating buyout price for asset {asset.id} to {buyout_price}€")
+            logger.info("Updating buyout price for asset %s to %s€", asset_id, buyout_price)
             updates['Buyout Price'] = float(buyout_price)
             buyout_price_updated = True
         
         # Format and update asset name
-        current_name = getattr(asset, 'name', None) or asset.attributes.get('Name', '')
-        new_name = self._format_asset_name(asset, device_age_months, buyout_price)
+        current_name = getattr(asset, 'name', None) or attrs.get('Name', '')
+        new_name = self._format_name(
+            attrs.get('Model'), attrs.get('Serial Number'), object_type,
+            device_age_months, buyout_price
+        )
         
         # Log the current and new names for debugging
-        self.logger.debug(f"Current asset name: '{current_name}'")
-        self.logger.debug(f"Formatted new name: '{new_name}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current asset name: '%s'", current_name)
+            logger.debug("Formatted new name: '%s'", new_name)
         
         # Always update name if buyout price changed or names don't match
         if buyout_price_updated or current_name != new_name:
-            self.logger.info(f"Updating asset {asset.id} name from '{current_name}' to '{new_name}'")
+            logger.info("Updating asset %s name from '%s' to '%s'", asset_id, current_name, new_name)
             updates['Name'] = new_name
         
-        # If we have any updates to make
-        if updates:
-            self.logger.debug(f"Updating asset {asset.id} with attributes: {list(updates.keys())}")
-            # Send the update to the API
-            self.client.update_object(asset.id, updates)
-            return True
-        else:
-            self.logger.debug(f"No updates needed for asset {asset.id}")
-            return True
+        # Drop values the asset already holds so unchanged assets cost no API call
+        unchanged = [
+            name for name, value in updates.items()
+            if str(current_name if name == 'Name' else attrs.get(name)) == str(value)
+        ]
+        for name in unchanged:
+            del updates[name]
+        if unchanged:
+            logger.debug("Skipping unchanged attributes for asset %s: %s", asset_id, unchanged)
+        
+        return updates
+    
+    def _apply_updates(self, asset: Asset, updates: Dict[str, Any]) -> None:
+        """
+        Send computed attribute updates for an asset to the API.
+        
+        Args:
+            asset: The asset being updated
+            updates: Attribute names mapped to their new values
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Updating asset %s with attributes: %s", asset.id, list(updates.keys()))
+        self.client.update_object(asset.id, updates)
             
-    def _is_buyout_eligible(self, asset: Asset) -> bool:
+    def _is_buyout_eligible(self, asset_id: str, object_type: Optional[str],
+                            purchase_cost: Any, purchase_date: Any) -> bool:
         """
         Determine if an asset is eligible for buyout price calculation.
         
         Args:
-            asset: The asset to check
+            asset_id: The ID of the asset, used for logging
+            object_type: The asset's object type name
+            purchase_cost: The asset's Purchase Cost attribute
+            purchase_date: The asset's Purchase Date attribute
             
         Returns:
             bool: True if the asset is eligible for buyout
         """
-        # Check if this is a device with purchase information
-        if not hasattr(asset, 'attributes'):
-            return False
-            
-        # Get the required attributes
-        object_type = asset.object_type if hasattr(asset, 'object_type') else None
-        purchase_cost = asset.attributes.get('Purchase Cost')
-        purchase_date = asset.attributes.get('Purchase Date')
-        
         # Check if we have the required data for buyout calculation
         if not object_type or not purchase_cost or not purchase_date:
             self.logger.debug(
-                f"Asset {asset.id} missing required buyout attributes: "
-                f"type={object_type}, cost={purchase_cost}, date={purchase_date}"
+                "Asset %s missing required buyout attributes: type=%s, cost=%s, date=%s",
+                asset_id, object_type, purchase_cost, purchase_date
             )
             return False
             
-        # Check if this is a supported device type
-        supported_types = self.buyout_calculator.TYPE_CATEGORY_MAP.keys()
-        if not any(device_type in object_type for device_type in supported_types):
-            self.logger.debug(f"Asset {asset.id} type '{object_type}' is not supported for buyout")
+        # Check if this is a supported device type; a batch holds few distinct types
+        supported = self._supported_types.get(object_type)
+        if supported is None:
+            supported = self._supported_types[object_type] = bool(self._supported_pattern.search(object_type))
+        if not supported:
+            self.logger.debug("Asset %s type '%s' is not supported for buyout", asset_id, object_type)
             return False
             
         return True
         
-    def _calculate_buyout_price(self, asset: Asset) -> Optional[Decimal]:
+    def _calculate_buyout_price(self, asset_id: str, object_type: Optional[str],
+                                purchase_cost: Any, purchase_date: Any) -> Optional[Decimal]:
         """
         Calculate the buyout price for an asset.
         
         Args:
-            asset: The asset to calculate buyout price for
+            asset_id: The ID of the asset, used for logging
+            object_type: The asset's object type name
+            purchase_cost: The asset's Purchase Cost attribute
+            purchase_date: The asset's Purchase Date attribute
             
         Returns:
             Decimal: The calculated buyout price, or None if calculation fails
         """
-        # Extract required attributes
-        purchase_cost = asset.attributes.get('Purchase Cost')
-        purchase_date = asset.attributes.get('Purchase Date')
-        object_type = asset.object_type if hasattr(asset, 'object_type') else ''
-        
         # Calculate buyout price
         buyout_price = self.buyout_calculator.calculate_buyout_price(
             purchase_cost=purchase_cost,
             purchase_date=purchase_date,
-            object_type=object_type
+            object_type=object_type or ''
         )
         
         if buyout_price is None:
-            self.logger.warning(f"Failed to calculate buyout price for asset {asset.id}")
+            self.logger.warning("Failed to calculate buyout price for asset %s", asset_id)
             
         return buyout_price
     
     def _format_asset_name(self, asset: Asset, device_age_months: Optional[int], 
                          buyout_price: Optional[Decimal]) -> str:
         """
-        Format the asset name according to business rules:
+        Format the asset name according to business rules.
+        
+        Thin wrapper around _format_name() for callers holding an Asset.
+        
+        Args:
+            asset: The asset to format the name for
+            device_age_months: The calculated device age in months
+            buyout_price: The calculated buyout price
+            
+        Returns:
+            str: The formatted asset name
+        """
+        attrs = asset.attributes
+        return self._format_name(
+            attrs.get('Model'),
+            attrs.get('Serial Number'),
+            getattr(asset, 'object_type', None),
+            device_age_months,
+            buyout_price
+        )
+    
+    @staticmethod
+    def _format_name(model: Optional[str], serial_number: Optional[str],
+                     object_type: Optional[str], device_age_months: Optional[int],
+                     buyout_price: Optional[Decimal]) -> str:
+        """
+        Format an asset name from already extracted values:
         - Format: "Model - Serial Number - Buyout Price: {price}€" (if age >= 18 months)
         - Format: "Model - Serial Number" (if age < 18 months)
         - If Model is not available, use ObjectType instead
         
         Args:
-            asset: The asset to format the name for
+            model: The asset's Model attribute
+            serial_number: The asset's Serial Number attribute
+            object_type: The asset's object type name
             device_age_months: The calculated device age in months
             buyout_price: The calculated buyout price
             
         Returns:
             str: The formatted asset name
         """
-        # Get model and serial number
-        model = asset.attributes.get('Model')
         if not model or not model.strip():
-            model = asset.object_type if hasattr(asset, 'object_type') else "Unknown Device"
+            model = object_type if object_type is not None else "Unknown Device"
             
-        serial_number = asset.attributes.get('Serial Number')
         if not serial_number or not serial_number.strip():
             serial_number = "Unknown"
             
-        # Start with "Model - Serial Number"
-        name_parts = [f"{model} - {serial_number}"]
-        
         # Add buyout price if device is 18+ months old and we have a price
         if device_age_months is not None and device_age_months >= 18 and buyout_price is not None:
-            name_parts.append(f"Buyout Price: {buyout_price}€")
-            
-        # Join parts with " - "
-        new_name = " - ".join(name_parts)
-        self.logger.debug(f"Formatted asset name: {new_name}")
-        
-        return new_name
+            return f"{model} - {serial_number} - Buyout Price: {buyout_price}€"
+        return f"{model} - {serial_number}"
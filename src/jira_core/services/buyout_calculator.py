@@ -4,6 +4,8 @@ Buyout price calculator for Jira Assets.
 This module provides the BuyoutCalculator class which implements business rules
 for calculating asset buyout prices based on purchase cost and age.
 """
+import logging
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from datetime import datetime, date
 from decimal import Decimal, ROUND_HALF_UP
@@ -96,6 +98,7 @@ class BuyoutCalculator:
             logger (Logger, optional): A custom logger instance.
         """
         self.logger = logger or Logger.configure()
+        self._today = None  # Date pinned for the duration of a batch, see AssetProcessor.process_assets
     
     def get_device_category(self, object_type: str) -> str:
         """
@@ -109,10 +112,10 @@ class BuyoutCalculator:
         """
         category = self.TYPE_CATEGORY_MAP.get(object_type)
         if not category:
-            self.logger.debug(f"Unknown object type '{object_type}', using Computers category")
+            self.logger.debug("Unknown object type '%s', using Computers category", object_type)
             category = "Computers"
         
-        self.logger.debug(f"Mapped object type '{object_type}' to category '{category}'")
+        self.logger.debug("Mapped object type '%s' to category '%s'", object_type, category)
         return category
     
     def get_residual_percentage(self, months: int, category: str) -> Decimal:
@@ -130,17 +133,16 @@ class BuyoutCalculator:
         lookup_month = min(months, 48)
         
         # Find percentage based on month and category
-        for entry in self.DEPRECIATION_TABLE:
-            if entry["month"] == lookup_month:
-                percentage = entry.get(category)
-                if percentage is not None:
-                    self.logger.debug(f"Found residual percentage {percentage}% for {category} at {months} months")
-                    return Decimal(str(percentage))
+        rates = _RESIDUAL_BY_CATEGORY.get(category)
+        if rates is not None and lookup_month >= 1:
+            percentage = rates[lookup_month - 1]
+            self.logger.debug("Found residual percentage %s%% for %s at %s months", percentage, category, months)
+            return percentage
         
-        # If beyond 48 months or not found, use minimum rate
-        min_rate = self.MIN_RATES.get(category, 10.20)
-        self.logger.debug(f"Using minimum residual percentage {min_rate}% for {category} at {months} months")
-        return Decimal(str(min_rate))
+        # If not found, use minimum rate
+        min_rate = _MIN_RATES.get(category, _DEFAULT_MIN_RATE)
+        self.logger.debug("Using minimum residual percentage %s%% for %s at %s months", min_rate, category, months)
+        return min_rate
     
     def calculate_buyout_price(self, 
                               purchase_cost: Optional[Any], 
@@ -163,10 +165,7 @@ class BuyoutCalculator:
             
         try:
             # Convert purchase cost to Decimal
-            if isinstance(purchase_cost, str):
-                purchase_cost = Decimal(purchase_cost.replace(',', '.').replace('€', '').strip())
-            else:
-                purchase_cost = Decimal(str(purchase_cost))
+            purchase_cost = _parse_amount(purchase_cost)
             
             # Calculate device age in months
             device_age_months = self.calculate_months_since_purchase(purchase_date)
@@ -176,28 +175,36 @@ class BuyoutCalculator:
             # Get device category
             category = self.get_device_category(object_type)
             
-            # Add VAT to purchase cost
-            cost_with_vat = purchase_cost * (Decimal('1') + self.VAT_RATE)
-            
-            # Get residual percentage for the given age and category
-            residual_percentage = self.get_residual_percentage(device_age_months, category)
+            # Get residual percentage, in hundredths of a percent, for the given age and category
+            residual_hundredths = _residual_hundredths(device_age_months, category)
             
-            # Calculate buyout price as residual percentage of cost with VAT
-            buyout_price = (cost_with_vat * (residual_percentage / Decimal('100'))).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            # Calculate buyout price as residual percentage of cost with VAT. Costs
+            # in whole cents take an exact integer path; others fall back to Decimal.
+            cost_cents = purchase_cost * _HUNDRED
+            if cost_cents == cost_cents.to_integral_value():
+                buyout_cents = _div_round_half_up(
+                    int(cost_cents) * _VAT_PERCENT * residual_hundredths, _BUYOUT_CENTS_DIVISOR)
+                buyout_price = Decimal(buyout_cents).scaleb(-2)
+            else:
+                buyout_price = (purchase_cost * _VAT_MULTIPLIER * Decimal(residual_hundredths)
+                                / _TEN_THOUSAND).quantize(_HUNDREDTH, rounding=ROUND_HALF_UP)
             
-            self.logger.debug(
-                f"Buyout calculation for {object_type} (category: {category}): "
-                f"Original cost = {purchase_cost}, "
-                f"With VAT = {cost_with_vat}, "
-                f"Age = {device_age_months} months, "
-                f"Residual % = {residual_percentage}%, "
-                f"Buyout price = {buyout_price}€"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Buyout calculation for %s (category: %s): "
+                    "Original cost = %s, "
+                    "With VAT = %s, "
+                    "Age = %s months, "
+                    "Residual %% = %s%%, "
+                    "Buyout price = %s€",
+                    object_type, category, purchase_cost, purchase_cost * _VAT_MULTIPLIER,
+                    device_age_months, Decimal(residual_hundredths).scaleb(-2), buyout_price
+                )
             
             return buyout_price
             
         except (ValueError, TypeError, ArithmeticError) as e:
-            self.logger.error(f"Error calculating buyout price: {str(e)}")
+            self.logger.error("Error calculating buyout price: %s", e)
             return None
     
     def should_update_buyout_price(self, 
@@ -228,15 +235,12 @@ class BuyoutCalculator:
             
         # Convert to Decimal for comparison
         try:
-            if isinstance(current_buyout, str):
-                current_decimal = Decimal(current_buyout.replace(',', '.').replace('€', '').strip())
-            else:
-                current_decimal = Decimal(str(current_buyout))
+            current_decimal = _parse_amount(current_buyout)
                 
             # Check if the difference is significant (more than €1)
             diff = abs(current_decimal - calculated_buyout)
-            if diff > Decimal('1'):
-                self.logger.debug(f"Buyout price difference {diff}€ exceeds threshold, update needed")
+            if diff > _UPDATE_THRESHOLD:
+                self.logger.debug("Buyout price difference %s€ exceeds threshold, update needed", diff)
                 return True
                 
             self.logger.debug("Current buyout price is up-to-date")
@@ -246,12 +250,15 @@ class BuyoutCalculator:
             self.logger.debug("Current buyout price format is invalid, update needed")
             return True
     
-    def calculate_months_since_purchase(self, purchase_date: str) -> Optional[int]:
+    def calculate_months_since_purchase(self, purchase_date: str,
+                                        today: Optional[date] = None) -> Optional[int]:
         """
         Calculate the number of months between purchase date and today.
         
         Args:
             purchase_date: Purchase date in YYYY-MM-DD format
+            today: Date to count up to; defaults to the batch date if one is
+                set, otherwise the current date
             
         Returns:
             int: Number of months, or None if date is invalid
@@ -260,22 +267,139 @@ class BuyoutCalculator:
             return None
             
         try:
-            purchase_dt = datetime.strptime(purchase_date, '%Y-%m-%d').date()
-            today = date.today()
-            
-            # Calculate years and months difference
-            years_diff = today.year - purchase_dt.year
-            months_diff = today.month - purchase_dt.month
-            
-            # Total months
-            total_months = years_diff * 12 + months_diff
-            
-            # Adjust for day of the month
-            if today.day < purchase_dt.day:
-                # If we haven't reached the same day of the month, subtract one month
-                total_months -= 1
-                
-            return max(0, total_months)
+            # Keyed on today's date so cached ages roll over at midnight
+            today = today or self._today or date.today()
+            return _months_since_purchase(purchase_date, today.toordinal())
         except (ValueError, TypeError):
-            self.logger.error(f"Invalid purchase date format: {purchase_date}, expected YYYY-MM-DD")
+            self.logger.error("Invalid purchase date format: %s, expected YYYY-MM-DD", purchase_date)
             return None
+
+
+@lru_cache(maxsize=4096)
+def _months_since_purchase(purchase_date: str, today_ordinal: int) -> int:
+    """
+    Count whole months from a purchase date to the given day.
+    
+    Assets bought on the same day share a purchase date string, so the
+    result is cached to avoid re-parsing it for every asset.
+    
+    Args:
+        purchase_date: Purchase date in YYYY-MM-DD format
+        today_ordinal: Proleptic Gregorian ordinal of today's date
+        
+    Returns:
+        int: Number of months, never negative
+        
+    Raises:
+        ValueError: If the date is not in YYYY-MM-DD format
+        TypeError: If the date is not a string
+    """
+    if len(purchase_date) == 10 and purchase_date[4] == '-' and purchase_date[7] == '-':
+        # Zero-padded YYYY-MM-DD, the usual form, is parsed in C without strptime's format walk
+        purchase_dt = date.fromisoformat(purchase_date)
+    else:
+        purchase_dt = datetime.strptime(purchase_date, '%Y-%m-%d').date()
+    today = date.fromordinal(today_ordinal)
+    
+    # Calculate years and months difference
+    years_diff = today.year - purchase_dt.year
+    months_diff = today.month - purchase_dt.month
+    
+    # Total months
+    total_months = years_diff * 12 + months_diff
+    
+    # Adjust for day of the month
+    if today.day < purchase_dt.day:
+        # If we haven't reached the same day of the month, subtract one month
+        total_months -= 1
+        
+    return max(0, total_months)
+
+
+# Lookup tables derived once from the class constants above.
+# Residual percentages per category, indexed by month - 1
+_RESIDUAL_BY_CATEGORY = {
+    category: tuple(Decimal(str(entry[category])) for entry in BuyoutCalculator.DEPRECIATION_TABLE)
+    for category in BuyoutCalculator.MIN_RATES
+}
+_MIN_RATES = {category: Decimal(str(rate)) for category, rate in BuyoutCalculator.MIN_RATES.items()}
+_DEFAULT_MIN_RATE = Decimal('10.2')
+_VAT_MULTIPLIER = Decimal('1') + BuyoutCalculator.VAT_RATE
+_HUNDRED = Decimal('100')
+_TEN_THOUSAND = Decimal('10000')
+_HUNDREDTH = Decimal('0.01')
+_UPDATE_THRESHOLD = Decimal('1')
+
+# Normalizes amounts like "999,99€" in one pass: decimal comma to point, drop the euro sign
+_AMOUNT_TRANSLATION = str.maketrans({',': '.', '€': None})
+
+# Integer forms of the same tables for exact cent arithmetic: residual rates in
+# hundredths of a percent and the VAT multiplier as a whole percentage
+_RESIDUAL_HUNDREDTHS = {
+    category: tuple(int(rate * _HUNDRED) for rate in rates)
+    for category, rates in _RESIDUAL_BY_CATEGORY.items()
+}
+_MIN_RATE_HUNDREDTHS = {category: int(rate * _HUNDRED) for category, rate in _MIN_RATES.items()}
+_DEFAULT_MIN_RATE_HUNDREDTHS = int(_DEFAULT_MIN_RATE * _HUNDRED)
+_VAT_PERCENT = int(_VAT_MULTIPLIER * _HUNDRED)
+# cents * VAT percent * residual hundredths carries a scale of 100 * 100 * 10000
+_BUYOUT_CENTS_DIVISOR = 100 * 100 * 100
+
+
+def _parse_amount(value: Any) -> Decimal:
+    """
+    Convert a monetary value from Jira to Decimal.
+    
+    Args:
+        value: Amount as a number or a string such as "999,99€"
+        
+    Returns:
+        Decimal: The parsed amount
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, str):
+        if ',' in value or '€' in value:
+            value = value.translate(_AMOUNT_TRANSLATION)
+        return Decimal(value.strip())
+    if isinstance(value, int) and not isinstance(value, bool):
+        return Decimal(value)
+    # Floats go through str() so 999.99 stays 999.99 rather than its binary expansion
+    return Decimal(str(value))
+
+
+def _residual_hundredths(months: int, category: str) -> int:
+    """
+    Get the residual percentage in hundredths of a percent.
+    
+    Integer counterpart of BuyoutCalculator.get_residual_percentage().
+    
+    Args:
+        months: Age of device in months
+        category: Device category (Computers, Phones, or Tablets)
+        
+    Returns:
+        int: Residual percentage multiplied by 100
+    """
+    lookup_month = min(months, 48)
+    rates = _RESIDUAL_HUNDREDTHS.get(category)
+    if rates is not None and lookup_month >= 1:
+        return rates[lookup_month - 1]
+    return _MIN_RATE_HUNDREDTHS.get(category, _DEFAULT_MIN_RATE_HUNDREDTHS)
+
+
+def _div_round_half_up(numerator: int, divisor: int) -> int:
+    """
+    Divide integers, rounding halves away from zero like ROUND_HALF_UP.
+    
+    Args:
+        numerator: The value to divide
+        divisor: A positive divisor
+        
+    Returns:
+        int: The rounded quotient
+    """
+    quotient, remainder = divmod(abs(numerator), divisor)
+    if remainder * 2 >= divisor:
+        quotient += 1
+    return -quotient if numerator < 0 else quotient
@@ -4,11 +4,181 @@ Logging configuration module for the Assets API Client.
 Provides a singleton Logger class that handles application logging to both
 console and file outputs with configurable log levels.
 """
+import atexit
+import contextvars
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Union
 
+# Prefix for records logged while handling a request, such as "[1a2b3c4d] "; set once per request
+_REQUEST_TAG = contextvars.ContextVar('request_tag', default='')
+
+
+def set_request_id(request_id):
+    """
+    Tag log records from the current context with a request ID.
+    
+    Each asyncio task runs in its own copy of the context, so the ID only
+    applies to records logged while handling that request.
+    
+    Args:
+        request_id (str): Short identifier for the request.
+    """
+    _REQUEST_TAG.set(f'[{request_id}] ')
+
+
+class _RequestTagFilter(logging.Filter):
+    """
+    Copy the current request tag onto each record.
+    
+    Attached to the queue handler so the tag is read in the logging
+    caller's context rather than on the listener thread.
+    """
+    
+    def filter(self, record):
+        """
+        Add the request tag to the record.
+        
+        Args:
+            record (logging.LogRecord): The record being logged.
+            
+        Returns:
+            bool: Always True; no records are dropped.
+        """
+        record.request_tag = _REQUEST_TAG.get()
+        return True
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders each second's timestamp only once.
+    
+    The default formatTime() calls time.strftime() for every record.
+    Records logged within the same second share the date and time text,
+    so it is cached and only the milliseconds are filled in per record.
+    """
+    
+    _cached_time = (None, '')  # (whole second, formatted text), replaced as a unit
+    
+    def formatTime(self, record, datefmt=None):
+        """
+        Format the record's creation time like logging.Formatter does.
+        
+        Args:
+            record (logging.LogRecord): The record being formatted.
+            datefmt (str, optional): Explicit date format; bypasses the cache.
+            
+        Returns:
+            str: The formatted time.
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_time = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+# Shared record format for the file and console handlers
+_FORMATTER = _CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(request_tag)s%(message)s')
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that batches records in a large write buffer.
+    
+    logging.FileHandler flushes after every record, costing one write()
+    syscall each. This handler leaves records in the buffer and flushes
+    immediately only for warnings and above. A background thread flushes
+    anything still buffered every flush_interval seconds, so records reach
+    the file even when no further records arrive. Closing the handler
+    writes out whatever is still buffered.
+    """
+    
+    def __init__(self, filename, buffer_size=65536, flush_interval=1.0, **kwargs):
+        """
+        Initialize the handler.
+        
+        Args:
+            filename (str): Path of the log file.
+            buffer_size (int): Size of the file write buffer in bytes.
+            flush_interval (float): Maximum seconds a record stays buffered.
+            **kwargs: Passed through to logging.FileHandler.
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._dirty = False  # Records written since the last flush
+        self._stop_flushing = threading.Event()
+        super().__init__(filename, **kwargs)
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name='log-flush', daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        """
+        Open the log file with the configured buffer size.
+        
+        Returns:
+            The opened text stream.
+        """
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def flush(self):
+        """
+        Skip the per-record flush made by StreamHandler.emit().
+        
+        Buffered records are written by emit() for warnings, by the
+        background flusher, and when the file is closed.
+        """
+    
+    def emit(self, record):
+        """
+        Write a record into the buffer, flushing at once for warnings and above.
+        
+        Args:
+            record (logging.LogRecord): The record to write.
+        """
+        super().emit(record)
+        self._dirty = True
+        if record.levelno >= logging.WARNING:
+            self._flush_buffer()
+    
+    def close(self):
+        """
+        Stop the background flusher and close the file, writing out the buffer.
+        """
+        self._stop_flushing.set()
+        super().close()
+    
+    def _flush_buffer(self):
+        """
+        Write buffered records to the file if there are any.
+        """
+        self.acquire()
+        try:
+            if self._dirty and self.stream:
+                self.stream.flush()
+                self._dirty = False
+        finally:
+            self.release()
+    
+    def _flush_periodically(self):
+        """
+        Flush the buffer every flush_interval seconds until the handler closes.
+        """
+        while not self._stop_flushing.wait(self.flush_interval):
+            self._flush_buffer()
+
+
 class Logger:
     """
     Singleton logger class for consistent logging across the application.
@@ -18,7 +188,8 @@ class Logger:
     methods for different log levels and configuration options.
     """
     _instance = None
-    _initialized = False
+    _listener = None  # Background QueueListener writing records to the handlers
+    _log_filename = None  # Log file of the current run, created on first configure
 
     # Constants for log levels, mirroring the standard logging module
     DEBUG = logging.DEBUG
@@ -34,30 +205,35 @@ class Logger:
         Returns:
             Logger: The singleton Logger instance.
         """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        """
-        Initialize the Logger instance if not already initialized.
-        """
-        if not Logger._initialized:
-            self.logger = logging.getLogger()
-            Logger._initialized = True
+        instance = cls._instance
+        if instance is None:
+            # Build and initialize the instance once; there is no __init__ to rerun on later calls
+            instance = cls._instance = super().__new__(cls)
+            root_logger = instance.logger = logging.getLogger()
+            # Bind the stdlib methods directly so each call skips a wrapper frame;
+            # they accept %-style arguments and skip disabled levels themselves
+            instance.isEnabledFor = root_logger.isEnabledFor
+            instance.debug = root_logger.debug
+            instance.info = root_logger.info
+            instance.warning = root_logger.warning
+            instance.error = root_logger.error
+            instance.critical = root_logger.critical
+        return instance
 
     @staticmethod
-    def configure(console_level=INFO, file_level=DEBUG):
+    def configure(console_level=None, file_level=None):
         """
         Configure the logging system with file and console handlers.
         
         Creates a timestamped log file in the 'logs' directory and sets up
-        both console and file logging with specified log levels.
+        both console and file logging with specified log levels. Once
+        configured, later calls reuse the existing handlers and only apply
+        the levels that are explicitly passed.
         
         Args:
-            console_level: Logging level for console output.
+            console_level: Logging level for console output, INFO by default.
                 Can be an int constant or a string ('DEBUG', 'INFO', etc.)
-            file_level: Logging level for file output.
+            file_level: Logging level for file output, DEBUG by default.
                 Can be an int constant or a string ('DEBUG', 'INFO', etc.)
             
         Returns:
@@ -68,75 +244,69 @@ class Logger:
             console_level = getattr(logging, console_level.upper(), logging.INFO)
         if isinstance(file_level, str):
             file_level = getattr(logging, file_level.upper(), logging.DEBUG)
+
+        # Already configured: keep the handlers and log file, just adjust levels
+        root_logger = logging.getLogger()
+        if Logger._listener is not None and root_logger.handlers:
+            file_handler, console_handler = Logger._listener.handlers
+            if file_level is not None:
+                file_handler.setLevel(file_level)
+            if console_level is not None:
+                console_handler.setLevel(console_level)
+            return Logger()
+
+        if console_level is None:
+            console_level = logging.INFO
+        if file_level is None:
+            file_level = logging.DEBUG
             
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
+        os.makedirs('logs', exist_ok=True)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_filename = f'logs/assets_api_{timestamp}.log'
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        # One log file per run, even if logging is configured again later
+        if Logger._log_filename is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            Logger._log_filename = f'logs/assets_api_{timestamp}.log'
+        log_filename = Logger._log_filename
 
         # Setup handlers
-        file_handler = logging.FileHandler(log_filename)
+        file_handler = BufferedFileHandler(log_filename)
         file_handler.setLevel(file_level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(console_level)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
+
+        # Hand records to a background thread so callers never block on file I/O
+        Logger._stop_listener()
+        log_queue = queue.Queue(-1)
+        Logger._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        Logger._listener.start()
 
         # Configure root logger
-        root_logger = logging.getLogger()
         root_logger.setLevel(logging.DEBUG)
         
-        # Clear existing handlers and add new ones
+        # Clear existing handlers and add the queue handler
         root_logger.handlers.clear()
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(console_handler)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(_RequestTagFilter())
+        root_logger.addHandler(queue_handler)
 
         return Logger()
 
-    def debug(self, message):
-        """
-        Log a debug message.
-        
-        Args:
-            message (str): The debug message to log.
-        """
-        self.logger.debug(message)
-
-    def info(self, message):
-        """
-        Log an info message.
-        
-        Args:
-            message (str): The info message to log.
-        """
-        self.logger.info(message)
-
-    def warning(self, message):
+    @staticmethod
+    def _stop_listener():
         """
-        Log a warning message.
-        
-        Args:
-            message (str): The warning message to log.
+        Stop the background log listener, writing out any queued records.
         """
-        self.logger.warning(message)
+        if Logger._listener is not None:
+            Logger._listener.stop()
+            for handler in Logger._listener.handlers:
+                handler.close()
+            Logger._listener = None
 
-    def error(self, message):
-        """
-        Log an error message.
-        
-        Args:
-            message (str): The error message to log.
-        """
-        self.logger.error(message)
 
-    def critical(self, message):
-        """
-        Log a critical message.
-        
-        Args:
-            message (str): The critical message to log.
-        """
-        self.logger.critical(message)
+# Drain queued log records before the interpreter exits
+atexit.register(Logger._stop_listener)
@@ -1,4 +1,4 @@
-from typing import Dict, Type
+from typing import Dict
 from .webhook_base import WebhookHandler
 from ..logging.logger import Logger
 
@@ -7,7 +7,8 @@ class WebhookRouter:
 
     def __init__(self):
         self.logger = Logger()
-        self.handlers: Dict[str, Type[WebhookHandler]] = {
+        # One handler instance per event type, built here and reused for every request
+        self.handlers: Dict[str, WebhookHandler] = {
             # Add more handlers here as needed
         }
 
@@ -16,7 +17,7 @@ class WebhookRouter:
         handler = self.handlers.get(event_type)
         
         if not handler:
-            self.logger.error(f"No handler found for event type: {event_type}")
+            self.logger.error("No handler found for event type: %s", event_type)
             raise ValueError(f"Unsupported webhook event type: {event_type}")
 
         await handler.handle(payload)
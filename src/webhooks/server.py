@@ -1,75 +1,133 @@
-from aiohttp import web
+from aiohttp import BasicAuth, web
 import base64
+import hmac
 import json
+import logging
+import uuid
 from ..config import Config
 from .router import WebhookRouter
-from ..logging.logger import Logger
+from ..logging.logger import Logger, set_request_id
+
+# Prefer orjson for (de)serialization, falling back to the stdlib codec
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
 
 logger = Logger()
 router = WebhookRouter()
 
+# Expected Basic auth credentials, encoded once for constant-time comparison
+_WEBHOOK_USERNAME = b'webhook'
+_WEBHOOK_PASSWORD = Config.WEBHOOK_SECRET_BYTES
+# The exact header a correctly configured sender produces, matched before any decoding
+_EXPECTED_AUTH_HEADER = (
+    b'Basic ' + base64.b64encode(_WEBHOOK_USERNAME + b':' + _WEBHOOK_PASSWORD)
+    if _WEBHOOK_PASSWORD is not None else None
+)
+
+# The acknowledgement never changes, so it is serialized once
+_SUCCESS_BODY = _dumps({
+    "status": "success",
+    "message": "Webhook received and logged"
+})
+
+def _check_credentials(auth_header: str) -> bool:
+    """
+    Check Basic auth credentials against the configured webhook secret.
+    
+    The raw header is compared against the precomputed expected header
+    first; it is only decoded if that does not match. Malformed headers
+    are rejected.
+    
+    Args:
+        auth_header: The Authorization header, starting with 'Basic '
+        
+    Returns:
+        bool: True if the credentials are valid
+    """
+    if _WEBHOOK_PASSWORD is None:
+        return False
+    if hmac.compare_digest(auth_header.encode('utf-8', 'surrogateescape'), _EXPECTED_AUTH_HEADER):
+        return True
+    
+    # Extract and validate credentials
+    try:
+        auth = BasicAuth.decode(auth_header, encoding='utf-8')
+    except ValueError:
+        return False
+    return (hmac.compare_digest(auth.login.encode(), _WEBHOOK_USERNAME)
+            and hmac.compare_digest(auth.password.encode(), _WEBHOOK_PASSWORD))
+
 async def handle_webhook(request):
     """Handle incoming webhook requests."""
-    logger.info(f"Received webhook request from {request.remote}")
-    logger.debug(f"Headers: {dict(request.headers)}")
+    # Correlate every record logged for this request
+    set_request_id(uuid.uuid4().hex[:8])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Headers: %s", dict(request.headers))
 
     # Basic Authentication
     auth_header = request.headers.get('Authorization')
     if not auth_header or not auth_header.startswith('Basic '):
-        logger.warning("No basic auth credentials")
+        logger.warning("No basic auth credentials in webhook request from %s", request.remote)
         return web.Response(
             status=401,
             headers={'WWW-Authenticate': 'Basic realm="Webhook Access"'}
         )
 
     try:
-        # Extract and validate credentials
-        encoded_credentials = auth_header.split(' ')[1]
-        decoded = base64.b64decode(encoded_credentials).decode('utf-8')
-        username, password = decoded.split(':')
-        
-        if username != 'webhook' or password != Config.WEBHOOK_SECRET:
-            logger.warning("Invalid webhook credentials")
+        if not _check_credentials(auth_header):
+            logger.warning("Invalid webhook credentials from %s", request.remote)
             return web.Response(status=401)
 
         # Parse the webhook payload
         try:
-            body = await request.text()
-            logger.info("Received webhook payload:")
-            logger.info(f"Body: {body}")
+            # Raw bytes go straight to the JSON parser; decoding is only needed for non-JSON bodies
+            body = await request.read()
             
             # Try to parse as JSON if present
             if body:
                 try:
-                    payload = json.loads(body)
-                except json.JSONDecodeError:
-                    payload = {"raw_body": body}
+                    payload = _loads(body)
+                except ValueError:  # JSONDecodeError, or UnicodeDecodeError from the stdlib parser
+                    payload = {"raw_body": body.decode('utf-8', 'replace')}
             else:
                 payload = {}
 
-            # Log query parameters if any
-            if request.query:
-                logger.info(f"Query parameters: {dict(request.query)}")
-                payload["query_params"] = dict(request.query)
+            # Record query parameters if any
+            query_params = None
+            if request.query_string:  # Plain string check; request.query parses into a MultiDict
+                query_params = dict(request.query)
+                payload["query_params"] = query_params
+
+            # One record per webhook instead of a line per detail
+            logger.info(
+                "Received webhook from %s: %d bytes, query parameters: %s",
+                request.remote, len(body), query_params
+            )
 
-            # Log the final constructed payload
-            logger.info(f"Processed payload: {json.dumps(payload, indent=2)}")
+            # Log the body and final constructed payload; both copy it, so only when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Body: %s", body.decode('utf-8', 'replace'))
+                logger.debug("Processed payload: %s", json.dumps(payload, indent=2))
 
             # For now, just acknowledge receipt
-            return web.json_response({
-                "status": "success",
-                "message": "Webhook received and logged"
-            })
+            return web.Response(text=_SUCCESS_BODY, content_type='application/json')
             
         except Exception as e:
-            logger.error(f"Error processing webhook: {str(e)}")
+            logger.error("Error processing webhook: %s", e)
             return web.json_response({
                 "error": "Failed to process webhook",
                 "details": str(e)
-            }, status=500)
+            }, status=500, dumps=_dumps)
 
     except Exception as e:
-        logger.error(f"Authentication error: {str(e)}")
+        logger.error("Authentication error: %s", e)
         return web.Response(status=401)
 
 async def start_webhook_server():
@@ -79,7 +137,8 @@ async def start_webhook_server():
     app.router.add_post('/webhook', handle_webhook)
     
     logger.info(f"Starting webhook server on {Config.WEBHOOK_HOST}:{Config.WEBHOOK_PORT}")
-    runner = web.AppRunner(app)
+    # Requests are already logged by handle_webhook, so skip aiohttp's access log
+    runner = web.AppRunner(app, access_log=None)
     await runner.setup()
     site = web.TCPSite(runner, Config.WEBHOOK_HOST, Config.WEBHOOK_PORT)
     await site.start()
@@ -1,15 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet
 
 class WebhookHandler(ABC):
     """Base class for all webhook handlers."""
     
+    # Top-level payload keys a handler requires; subclasses override this
+    required_fields: FrozenSet[str] = frozenset()
+    
     @abstractmethod
     async def handle(self, payload: Dict[str, Any]) -> None:
         """Handle incoming webhook payload."""
         pass
 
-    @abstractmethod
     def validate_payload(self, payload: Dict[str, Any]) -> bool:
-        """Validate incoming webhook payload."""
-        pass
+        """Validate incoming webhook payload has all required fields."""
+        # One C-level subset test against the dict's key view
+        return self.required_fields <= payload.keys()